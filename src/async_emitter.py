@@ -11,8 +11,10 @@ Following SOLID principles:
 """
 
 import logging
-import queue
+import sys
 import threading
+import time
+from collections import deque
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -37,7 +39,17 @@ class AsyncEmitter:
         """
         self.formatter = formatter
         self.websocket_manager = websocket_manager
-        self.emit_queue = queue.Queue(maxsize=queue_size)
+        # deque + Event instead of queue.Queue: single producer/consumer, so the
+        # deque's atomic append/popleft avoid Queue's mutex + condition overhead
+        self.emit_queue = deque()
+        self.queue_size = queue_size
+        self._wake = threading.Event()
+        
+        # Console output is written without per-item flush; the worker
+        # flushes once the queue drains (or at most every flush_interval_s)
+        self._out = sys.stdout
+        self.flush_interval_s = 0.05
+        self._last_flush = 0.0
         self.is_running = False
         self.emit_thread = None
         self.stats = {
@@ -78,11 +90,9 @@ class AsyncEmitter:
         logger.info("Stopping AsyncEmitter...")
         self.is_running = False
         
-        # Signal stop by putting None
-        try:
-            self.emit_queue.put(None, timeout=1.0)
-        except queue.Full:
-            pass
+        # Signal stop by putting None (bypasses the size limit)
+        self.emit_queue.append(None)
+        self._wake.set()
         
         if self.emit_thread:
             self.emit_thread.join(timeout=2.0)
@@ -93,6 +103,8 @@ class AsyncEmitter:
     def emit(self, text: str, result: Dict[str, Any], words: Optional[List[Dict]] = None) -> bool:
         """
         Queue transcription for emission (non-blocking).
+        When the queue is full the oldest queued result is dropped, so the
+        newest transcription is always delivered.
         
         Args:
             text: Transcription text
@@ -100,79 +112,110 @@ class AsyncEmitter:
             words: Optional list of word dictionaries with timestamps
             
         Returns:
-            bool: True if queued, False if dropped (queue full)
+            bool: True if queued without loss, False if an older result was dropped
         """
-        try:
-            # Non-blocking put
-            self.emit_queue.put_nowait({
-                'text': text,
-                'result': result,
-                'words': words
-            })
-            return True
-        except queue.Full:
-            self.stats['dropped'] += 1
-            logger.warning(f"⚠️ Emission queue full, dropped result (total dropped: {self.stats['dropped']})")
-            return False
+        dropped = False
+        if len(self.emit_queue) >= self.queue_size:
+            try:
+                oldest = self.emit_queue.popleft()
+            except IndexError:
+                pass  # Worker drained the queue in the meantime
+            else:
+                if oldest is None:
+                    # Stop signal, not a result: keep it for the worker
+                    self.emit_queue.appendleft(None)
+                else:
+                    dropped = True
+                    self.stats['dropped'] += 1
+                    logger.warning(f"⚠️ Emission queue full, dropped oldest result (total dropped: {self.stats['dropped']})")
+        
+        # Non-blocking put
+        self.emit_queue.append({
+            'text': text,
+            'result': result,
+            'words': words
+        })
+        self._wake.set()
+        return not dropped
 
     def _emit_worker(self) -> None:
         """
         Worker thread that performs actual emission.
         
-        Runs in background, pulling from queue and emitting results.
-        All I/O blocking happens here, not in the main pipeline.
+        Runs in background, draining all queued results per wake-up and
+        emitting them as one batch. All I/O blocking happens here, not in
+        the main pipeline.
         """
         logger.info("AsyncEmitter worker thread started")
         
-        while self.is_running:
+        stop_requested = False
+        while self.is_running and not stop_requested:
             try:
-                # Wait for next emission
-                item = self.emit_queue.get(timeout=0.5)
+                # Drain everything queued so a burst costs one emission pass
+                batch = []
+                while True:
+                    try:
+                        item = self.emit_queue.popleft()
+                    except IndexError:
+                        break
+                    # None is stop signal
+                    if item is None:
+                        stop_requested = True
+                        break
+                    batch.append(item)
                 
-                # None is stop signal
-                if item is None:
-                    break
+                if not batch:
+                    if not stop_requested:
+                        # Queue empty: wait for emit() to signal, then re-check
+                        self._wake.wait(timeout=0.5)
+                        self._wake.clear()
+                    continue
                 
                 # Perform emission (all blocking I/O happens here)
-                self._do_emit(item)
+                self._do_emit(batch)
                 
-                self.stats['emitted'] += 1
+                self.stats['emitted'] += len(batch)
+                
+                # Flush when caught up (keeps latency low) or periodically under load
+                now = time.monotonic()
+                if not self.emit_queue or now - self._last_flush >= self.flush_interval_s:
+                    self._out.flush()
+                    self._last_flush = now
                 
-            except queue.Empty:
-                continue
             except Exception as e:
                 self.stats['errors'] += 1
                 logger.error(f"❌ Emission error: {e}", exc_info=True)
         
+        self._out.flush()
         logger.info("AsyncEmitter worker thread stopped")
 
-    def _do_emit(self, item: Dict[str, Any]) -> None:
+    def _do_emit(self, batch: List[Dict[str, Any]]) -> None:
         """
-        Perform actual emission to all outputs.
+        Perform actual emission of a batch of results to all outputs.
         
         Args:
-            item: Dictionary with 'text', 'result', 'words'
+            batch: List of dictionaries with 'text', 'result', 'words'
         """
         try:
-            text = item['text']
-            result = item['result']
-            words = item.get('words')
-            
-            # Format display text
-            display_text = self.formatter.format_display_text(text, result)
+            lines = []
+            payloads = []
+            for item in batch:
+                text = item['text']
+                result = item['result']
+                
+                # Format display text
+                lines.append(self.formatter.format_display_text(text, result))
+                
+                # Fallback for string results
+                payloads.append(result if isinstance(result, dict) else {'text': text})
             
-            # Emit to console (blocking, but in background thread)
-            print(display_text, flush=True)
+            # Emit to console in one buffered write (flushed by the worker)
+            self._out.write('\n'.join(lines) + '\n')
             
-            # Emit to WebSocket (blocking, but in background thread)
+            # Emit to WebSocket with one hand-off per batch (blocking, but in background thread)
             if self.websocket_manager and self.websocket_manager.is_running:
                 try:
-                    # Use the correct broadcast method
-                    if isinstance(result, dict):
-                        self.websocket_manager.broadcast_transcription(result)
-                    else:
-                        # Fallback for string results
-                        self.websocket_manager.broadcast_transcription({'text': text})
+                    self.websocket_manager.broadcast_transcriptions(payloads)
                 except Exception as e:
                     logger.debug(f"WebSocket broadcast error: {e}")
             
@@ -199,4 +242,4 @@ class AsyncEmitter:
         Returns:
             int: Number of items in queue
         """
-        return self.emit_queue.qsize()
+        return len(self.emit_queue)
@@ -0,0 +1,69 @@
+"""
+Audio Buffer
+============
+Preallocated accumulation buffer for raw audio samples.
+
+Replaces `np.concatenate` buffer growth (which reallocates and copies the
+whole buffer for every incoming chunk) with in-place writes into a fixed
+array, and retains the overlap tail with an in-place move.
+"""
+
+import numpy as np
+
+
+class AudioBuffer:
+    """Append-only sample buffer with in-place overlap retention"""
+
+    def __init__(self, capacity: int, dtype=np.int16):
+        """
+        Initialize audio buffer.
+
+        Args:
+            capacity: Initial capacity in samples (grows if exceeded)
+            dtype: Sample data type
+        """
+        self._buf = np.empty(max(int(capacity), 1), dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, chunk: np.ndarray) -> None:
+        """
+        Append samples to the end of the buffer.
+
+        Args:
+            chunk: Audio samples to append
+        """
+        end = self._size + len(chunk)
+        if end > len(self._buf):
+            self._grow(end)
+        self._buf[self._size:end] = chunk
+        self._size = end
+
+    def view(self) -> np.ndarray:
+        """
+        Get the buffered samples without copying.
+
+        Returns:
+            np.ndarray: View that is only valid until the next append/keep_tail
+        """
+        return self._buf[:self._size]
+
+    def keep_tail(self, num_samples: int) -> None:
+        """
+        Keep only the last samples, moved to the start of the buffer.
+
+        Args:
+            num_samples: Number of trailing samples to keep
+        """
+        num_samples = min(max(num_samples, 0), self._size)
+        if num_samples > 0:
+            self._buf[:num_samples] = self._buf[self._size - num_samples:self._size]
+        self._size = num_samples
+
+    def _grow(self, required: int) -> None:
+        """Reallocate to fit at least `required` samples (rare: calibration backlog)"""
+        new_buf = np.empty(max(required, 2 * len(self._buf)), dtype=self._buf.dtype)
+        new_buf[:self._size] = self._buf[:self._size]
+        self._buf = new_buf
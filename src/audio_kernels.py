@@ -0,0 +1,79 @@
+"""
+Audio Kernels
+=============
+Numba-compiled inner loops for the per-window audio math (VAD features and
+int16 RMS), with numpy fallbacks when numba is not installed.
+
+The kernels are single-threaded on purpose: the pipeline stages already run
+on separate cores, so a parallel reduction would only compete with them.
+"""
+
+import logging
+import numpy as np
+
+try:
+    # JIT-compiled kernels (optional)
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def fused_rms_zcr(x):
+        """Single pass over float32 audio returning (rms, zcr)"""
+        n = x.shape[0]
+        sum_sq = 0.0
+        crossings = 0
+        prev_neg = x[0] < 0.0
+        for i in range(n):
+            v = x[i]
+            sum_sq += v * v
+            neg = v < 0.0
+            crossings += neg != prev_neg
+            prev_neg = neg
+        return np.sqrt(sum_sq / n + 1e-12), crossings / n
+
+    @njit(cache=True, boundscheck=False)
+    def _int16_sum_squares(x):
+        """Exact sum of squares of int16 samples (int64 accumulator)"""
+        acc = 0
+        for i in range(x.shape[0]):
+            v = np.int32(x[i])
+            acc += v * v
+        return acc
+else:
+    fused_rms_zcr = None
+    _int16_sum_squares = None
+
+
+def int16_rms(audio: np.ndarray) -> float:
+    """
+    Normalized RMS of int16 samples without a float copy.
+
+    Args:
+        audio: int16 samples
+
+    Returns:
+        float: RMS in [0, 1] (full scale = 1.0)
+    """
+    n = len(audio)
+    if n == 0:
+        return 0.0
+    if _int16_sum_squares is not None:
+        sum_sq = _int16_sum_squares(audio)
+    else:
+        # Integer sum of squares (int64 accumulator), scale once
+        sum_sq = np.einsum('i,i->', audio, audio, dtype=np.int64)
+    return float(np.sqrt(sum_sq / (n * 32768.0 * 32768.0) + 1e-12))
+
+
+def warmup() -> None:
+    """Pay the JIT compile (or cache load) cost at startup, not on the first chunk"""
+    if njit is None:
+        return
+    fused_rms_zcr(np.zeros(2, dtype=np.float32))
+    _int16_sum_squares(np.zeros(2, dtype=np.int16))
+    logger.info("⚡ Numba audio kernels ready")
@@ -12,8 +12,10 @@ Supports two modes:
 import logging
 import threading
 import time
-import hashlib
+from typing import Optional
 import numpy as np
+from audio_buffer import AudioBuffer
+from thread_tuning import tune_thread
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +61,7 @@ class AudioProcessingPipeline:
         # Pipeline settings
         self.chunk_duration = config['chunk_duration']
         self.overlap_duration = config['overlap_duration']
+        self.drain_blocks = max(1, config.get('audio_drain_blocks', 16))  # Capture blocks per read
         self.enable_timeline_merging = (timeline_merger is not None)
         
         # Pipeline mode: parallel or sequential
@@ -68,8 +71,9 @@ class AudioProcessingPipeline:
         # Pipeline state
         self.worker_thread = None
         self.is_running = False
+        self._stop_event = threading.Event()  # Set by stop() to end the worker promptly
         self.chunk_counter = 0
-        self.chunk_duration_ms = self.chunk_duration * 1000
+        self.chunk_duration_ms = int(round(self.chunk_duration * 1000))  # Integer offsets for the merger
         
         # Initialize parallel pipeline if enabled
         if self.enable_parallel_pipeline:
@@ -108,6 +112,7 @@ class AudioProcessingPipeline:
         self.noise_calibrator.set_sample_rate(device_rate)
         
         self.is_running = True
+        self._stop_event.clear()
         
         # Start appropriate pipeline mode
         if self.enable_parallel_pipeline:
@@ -137,6 +142,10 @@ class AudioProcessingPipeline:
             
             logger.info("Audio processing pipeline started (sequential mode)")
         
+        # Keep the worker on the fast cores
+        tune_thread(self.worker_thread, self.config.get('worker_cpus'), self.config.get('worker_nice'),
+                    self.config.get('worker_rt_priority'))
+        
         return True
 
     def stop(self) -> None:
@@ -146,6 +155,10 @@ class AudioProcessingPipeline:
         
         logger.info("Stopping audio processing pipeline...")
         self.is_running = False
+        self._stop_event.set()
+        
+        # Unblock a worker waiting for audio so it sees the stop immediately
+        self.audio_stream.wake_consumer()
         
         # Stop parallel pipeline if enabled
         if self.enable_parallel_pipeline and self.parallel_orchestrator:
@@ -154,8 +167,28 @@ class AudioProcessingPipeline:
         if self.worker_thread:
             self.worker_thread.join(timeout=5.0)
         
+        # Write out any transcripts still queued for the console
+        self.formatter.close()
+        
         logger.info("Audio processing pipeline stopped")
 
+    def _blocks_until_full(self, buffered: int, window: int, block_size: int) -> int:
+        """
+        Number of capture blocks to drain at once without overshooting the window.
+        
+        Args:
+            buffered: Samples already buffered
+            window: Samples per analysis window
+            block_size: Samples per capture block
+            
+        Returns:
+            int: Blocks to request (at least 1, at most drain_blocks)
+        """
+        missing = window - buffered
+        if missing <= 0:
+            return 1
+        return min(self.drain_blocks, -(-missing // block_size))
+
     def _parallel_audio_feeder(self) -> None:
         """
         Lightweight worker that feeds audio to parallel pipeline.
@@ -169,8 +202,6 @@ class AudioProcessingPipeline:
         All processing (resample, VAD, features, inference, decode, merge)
         happens in parallel pipeline stages.
         """
-        audio_buffer = np.array([], dtype=np.int16)
-        
         # Get stream info
         stream_info = self.audio_stream.get_stream_info()
         dev_rate = stream_info['device_rate']
@@ -179,31 +210,39 @@ class AudioProcessingPipeline:
         buffer_size_dev = int(dev_rate * self.chunk_duration)
         overlap_size_dev = int(dev_rate * self.overlap_duration)
         
+        # Preallocated accumulation buffer (full window + one incoming chunk)
+        max_chunk = self.config['chunk_size'] * (stream_info.get('channels') or 1)
+        sample_buffer = AudioBuffer(buffer_size_dev + max_chunk)
+        
         logger.info(f"Parallel audio feeder started | Buffer: {self.chunk_duration}s | "
                    f"Overlap: {self.overlap_duration}s | dev={dev_rate}Hz")
         
-        while self.is_running:
+        while not self._stop_event.is_set():
             try:
-                # Get next audio chunk
-                chunk = self.audio_stream.get_audio_chunk(timeout=0.1)
+                # Get all queued audio up to a full window in one read
+                chunk = self.audio_stream.get_audio_chunk(
+                    timeout=0.1,
+                    max_blocks=self._blocks_until_full(len(sample_buffer), buffer_size_dev, max_chunk)
+                )
                 if chunk is None:
                     continue
                 
-                audio_buffer = np.concatenate([audio_buffer, chunk])
+                sample_buffer.append(chunk)
                 
                 # Bootstrap noise floor calibration
                 if not self.noise_calibrator.is_calibrated():
-                    if self.noise_calibrator.bootstrap_calibration(audio_buffer):
+                    if self.noise_calibrator.bootstrap_calibration(sample_buffer.view()):
                         logger.info("Noise floor calibration complete")
                     continue
                 
                 # Wait for full buffer
-                if len(audio_buffer) < buffer_size_dev:
+                if len(sample_buffer) < buffer_size_dev:
                     continue
                 
-                # Submit to parallel pipeline (non-blocking)
+                # Submit to parallel pipeline (non-blocking). The window is queued
+                # while the buffer is refilled, so it gets its own copy (one per window).
                 self.parallel_orchestrator.submit_audio_chunk(
-                    audio_buffer,
+                    sample_buffer.view().copy(),
                     self.chunk_counter
                 )
                 
@@ -211,7 +250,7 @@ class AudioProcessingPipeline:
                 self.chunk_counter += 1
                 
                 # Keep overlap
-                audio_buffer = self._keep_overlap(audio_buffer, overlap_size_dev)
+                sample_buffer.keep_tail(overlap_size_dev)
                 
             except Exception as e:
                 logger.error(f"Audio feeder error: {e}", exc_info=True)
@@ -225,8 +264,6 @@ class AudioProcessingPipeline:
         
         Orchestrates the complete audio processing pipeline sequentially.
         """
-        audio_buffer = np.array([], dtype=np.int16)
-        
         # Get stream info
         stream_info = self.audio_stream.get_stream_info()
         dev_rate = stream_info['device_rate']
@@ -235,17 +272,25 @@ class AudioProcessingPipeline:
         buffer_size_dev = int(dev_rate * self.chunk_duration)
         overlap_size_dev = int(dev_rate * self.overlap_duration)
         
+        # Preallocated accumulation buffer (full window + one incoming chunk)
+        max_chunk = self.config['chunk_size'] * (stream_info.get('channels') or 1)
+        sample_buffer = AudioBuffer(buffer_size_dev + max_chunk)
+        
         logger.info(f"Audio pipeline worker started | Buffer: {self.chunk_duration}s | "
                    f"Overlap: {self.overlap_duration}s | dev={dev_rate}Hz → model=16000Hz")
         
-        while self.is_running:
+        while not self._stop_event.is_set():
             try:
-                # Get next audio chunk
-                chunk = self.audio_stream.get_audio_chunk(timeout=0.1)
+                # Get all queued audio up to a full window in one read
+                chunk = self.audio_stream.get_audio_chunk(
+                    timeout=0.1,
+                    max_blocks=self._blocks_until_full(len(sample_buffer), buffer_size_dev, max_chunk)
+                )
                 if chunk is None:
                     continue
                 
-                audio_buffer = np.concatenate([audio_buffer, chunk])
+                sample_buffer.append(chunk)
+                audio_buffer = sample_buffer.view()
                 
                 # Bootstrap noise floor calibration
                 if not self.noise_calibrator.is_calibrated():
@@ -254,34 +299,51 @@ class AudioProcessingPipeline:
                     continue
                 
                 # Wait for full buffer
-                if len(audio_buffer) < buffer_size_dev:
+                if len(sample_buffer) < buffer_size_dev:
                     continue
                 
+                # Reject clearly silent windows before the VAD features
+                noise_floor = self.noise_calibrator.get_noise_floor()
+                silent = self.audio_processor.fast_reject(audio_buffer, noise_floor)
+                
                 # Resample to model rate
                 x16 = self.audio_processor.resample_to_model_rate(audio_buffer)
                 
+                if silent:
+                    # Noise floor history stays on the model-rate RMS scale
+                    self.noise_calibrator.update_adaptive_noise_floor(self.audio_processor.calculate_rms(x16))
+                    sample_buffer.keep_tail(overlap_size_dev)
+                    continue
+                
                 # Voice Activity Detection
-                noise_floor = self.noise_calibrator.get_noise_floor()
                 is_speech, vad_metrics = self.audio_processor.is_speech_segment(x16, noise_floor)
                 
                 if not is_speech:
-                    logger.debug(f"Skip (VAD): RMS={vad_metrics['rms']:.4f} "
-                               f"ZCR={vad_metrics['zcr']:.3f} "
-                               f"Entropy={vad_metrics['spectral_entropy']:.3f}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Skip (VAD): RMS=%.4f ZCR=%.3f Entropy=%.3f",
+                                     vad_metrics['rms'], vad_metrics['zcr'],
+                                     vad_metrics['spectral_entropy'])
                     
                     # Update adaptive noise floor
                     self.noise_calibrator.update_adaptive_noise_floor(vad_metrics['rms'])
                     
                     # Keep overlap
-                    audio_buffer = self._keep_overlap(audio_buffer, overlap_size_dev)
+                    sample_buffer.keep_tail(overlap_size_dev)
                     continue
                 
-                logger.debug(f"✅ Speech detected: RMS={vad_metrics['rms']:.4f} "
-                           f"ZCR={vad_metrics['zcr']:.3f} "
-                           f"Entropy={vad_metrics['spectral_entropy']:.3f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("✅ Speech detected: RMS=%.4f ZCR=%.3f Entropy=%.3f",
+                                 vad_metrics['rms'], vad_metrics['zcr'],
+                                 vad_metrics['spectral_entropy'])
                 
-                # Generate audio fingerprint for deduplication
-                audio_hash = hashlib.md5(x16.tobytes()).hexdigest()[:16]
+                # Generate audio fingerprint for deduplication (skipped when disabled)
+                audio_hash = self.audio_processor.fingerprint(x16) if self.decoder.dedup_enabled else None
+                
+                # Already decoded: skip features and inference entirely
+                if self.decoder.is_duplicate(audio_hash):
+                    logger.debug("🔄 Skip duplicate audio chunk (hash: %016x)", audio_hash)
+                    sample_buffer.keep_tail(overlap_size_dev)
+                    continue
                 
                 # Start language warmup on first speech
                 if self.language_manager.is_enabled() and not self.language_manager.is_locked():
@@ -290,6 +352,10 @@ class AudioProcessingPipeline:
                 # Get current language
                 current_language = self.language_manager.get_current_language()
                 
+                # Abandon the chunk if shutdown was requested during VAD
+                if self._stop_event.is_set():
+                    break
+                
                 # Convert to features
                 mel_input = self.audio_processor.audio_to_features(
                     x16, current_language, self.config['use_itn']
@@ -304,13 +370,13 @@ class AudioProcessingPipeline:
                         self._process_transcription_result(result, audio_hash)
                 
                 # Keep overlap
-                audio_buffer = self._keep_overlap(audio_buffer, overlap_size_dev)
+                sample_buffer.keep_tail(overlap_size_dev)
                 
             except Exception as e:
                 logger.error(f"Audio processing error: {e}", exc_info=True)
                 self.statistics.record_error()
 
-    def _run_inference(self, mel_input: np.ndarray, audio_hash: str) -> dict:
+    def _run_inference(self, mel_input: np.ndarray, audio_hash: Optional[int]) -> dict:
         """
         Run NPU inference and decode output.
         
@@ -323,15 +389,15 @@ class AudioProcessingPipeline:
         """
         try:
             # Run inference
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             npu_output = self.model_manager.run_inference(mel_input)
-            inference_time = (time.time() - start_time) * 1000
+            inference_ns = time.perf_counter_ns() - start_ns
             
             if npu_output is None:
                 return None
             
             # Record statistics
-            self.statistics.record_inference(inference_time)
+            self.statistics.record_inference(inference_ns)
             
             # Decode transcription
             result = self.decoder.decode_output(npu_output, audio_hash)
@@ -346,7 +412,7 @@ class AudioProcessingPipeline:
             logger.error(f"Inference error: {e}")
             return None
 
-    def _process_transcription_result(self, result: dict, audio_hash: str) -> None:
+    def _process_transcription_result(self, result: dict, audio_hash: Optional[int]) -> None:
         """
         Process transcription result: language lock, filtering, merging, output.
         
@@ -363,7 +429,7 @@ class AudioProcessingPipeline:
             # Apply metadata filtering
             should_filter, filter_reason = self.formatter.check_metadata_filter(result)
             if should_filter:
-                logger.debug(f"🚫 {filter_reason}: '{result['text']}'")
+                logger.debug("🚫 %s: '%s'", filter_reason, result['text'])
                 self.chunk_counter += 1
                 return
             
@@ -428,22 +494,6 @@ class AudioProcessingPipeline:
         display_text = self.formatter.format_display_text(result['text'], result)
         self.formatter.emit_transcription(display_text, result)
 
-    @staticmethod
-    def _keep_overlap(audio_buffer: np.ndarray, overlap_size: int) -> np.ndarray:
-        """
-        Keep overlap samples from buffer.
-        
-        Args:
-            audio_buffer: Current audio buffer
-            overlap_size: Number of samples to keep
-            
-        Returns:
-            np.ndarray: Overlap samples
-        """
-        if overlap_size > 0:
-            return audio_buffer[-overlap_size:]
-        return np.array([], dtype=np.int16)
-
     def get_pipeline_status(self) -> dict:
         """
         Get current pipeline status.
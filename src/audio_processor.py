@@ -5,25 +5,81 @@ Audio Processing Module
 Handles audio input, feature extraction, and preprocessing for SenseVoice.
 """
 
+import hashlib
 import numpy as np
 from typing import Optional, Tuple, Dict
 import logging
 import kaldi_native_fbank as knf
 
+import audio_kernels
+from audio_kernels import fused_rms_zcr, int16_rms
+
+try:
+    # SIMD-accelerated hash for audio fingerprints (optional)
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    # pocketfft with plan cache; keeps float32 input in single precision
+    from scipy.fft import rfft
+except ImportError:
+    rfft = np.fft.rfft
+
+try:
+    # C polyphase FIR loop for resampling with prebuilt taps
+    from scipy.signal import firwin, upfirdn
+except ImportError:
+    firwin = upfirdn = None
+
 logger = logging.getLogger(__name__)
 
 # SenseVoice constants
 RKNN_INPUT_LEN = 171
+NUM_QUERY_ROWS = 4  # language + event/emotion (2) + text-norm query rows
 SPEECH_SCALE = 1/4  # For fp16 inference to prevent overflow (reduced for better stability)
 
+# int16 <-> float32 scale factors (numpy scalars built once, not per call)
+INT16_RANGE = np.float32(1 << 15)
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
 # Language mapping
 LANGUAGES = {"auto": 0, "zh": 3, "en": 4, "yue": 7, "ja": 11, "ko": 12, "nospeech": 13}
 
+# Kaldi fbank defaults (used by the numpy fbank backend to match knf output)
+KALDI_PREEMPH_COEFF = 0.97
+KALDI_MEL_LOW_FREQ = 20.0
+KALDI_LOG_EPS = np.finfo(np.float32).eps
+
+
+def _kaldi_mel_banks(num_bins: int, samp_freq: float, n_fft: int,
+                     low_freq: float = KALDI_MEL_LOW_FREQ, high_freq: float = 0.0) -> np.ndarray:
+    """Build Kaldi-style triangular mel filterbank weights, shape (num_bins, n_fft // 2)"""
+    def mel_scale(freq):
+        return 1127.0 * np.log(1.0 + freq / 700.0)
+
+    nyquist = 0.5 * samp_freq
+    if high_freq <= 0.0:
+        high_freq += nyquist
+    mel_low, mel_high = mel_scale(low_freq), mel_scale(high_freq)
+    delta = (mel_high - mel_low) / (num_bins + 1)
+
+    left = mel_low + np.arange(num_bins) * delta
+    center = left + delta
+    right = center + delta
+    mel = mel_scale((samp_freq / n_fft) * np.arange(n_fft // 2))
+
+    rising = (mel[None, :] - left[:, None]) / (center - left)[:, None]
+    falling = (right[:, None] - mel[None, :]) / (right - center)[:, None]
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+
 class WavFrontend:
     """SenseVoice frontend for proper feature extraction"""
 
     def __init__(self, cmvn_file: str = None, fs: int = 16000, n_mels: int = 80,
-                 frame_length: int = 25, frame_shift: int = 10, lfr_m: int = 7, lfr_n: int = 6):
+                 frame_length: int = 25, frame_shift: int = 10, lfr_m: int = 7, lfr_n: int = 6,
+                 fbank_backend: str = "knf"):
         opts = knf.FbankOptions()
         opts.frame_opts.samp_freq = fs
         opts.frame_opts.dither = 0
@@ -40,57 +96,132 @@ class WavFrontend:
         self.lfr_n = lfr_n
         self.cmvn_file = cmvn_file
 
+        self._feat_buf = None  # Reused knf fbank output buffer
+
+        # One-time probe: newer knf bindings take a float32 ndarray directly,
+        # older ones need a Python list (one boxed float per sample)
+        try:
+            knf.OnlineFbank(opts).accept_waveform(fs, np.zeros(16, dtype=np.float32))
+            self._knf_accepts_ndarray = True
+        except TypeError:
+            self._knf_accepts_ndarray = False
+
+        # Fbank backend: 'knf' (kaldi-native-fbank) or 'numpy' (vectorized, Kaldi-compatible)
+        self.fbank_backend = fbank_backend
+        if fbank_backend == "numpy":
+            self._win_len = int(fs * frame_length / 1000)
+            self._win_shift = int(fs * frame_shift / 1000)
+            self._n_fft = 1 << (self._win_len - 1).bit_length()  # Round up to power of two
+            self._window = np.hamming(self._win_len).astype(np.float32)
+            self._mel_banks_t = np.ascontiguousarray(_kaldi_mel_banks(n_mels, fs, self._n_fft).T)
+
         if self.cmvn_file and self.cmvn_file.exists():
             self.cmvn = self.load_cmvn()
+            # float32 rows used for broadcasting in apply_cmvn
+            self._neg_mean = self.cmvn[0]  # <AddShift>
+            self._inv_std = self.cmvn[1]  # <Rescale>
         else:
             self.cmvn = None
+            self._neg_mean = None
+            self._inv_std = None
 
     def fbank(self, waveform: np.ndarray):
-        """Extract fbank features"""
-        waveform = waveform * (1 << 15)
+        """
+        Extract fbank features.
+        The knf path returns a view of a reused buffer; callers must copy to retain it
+        (apply_lfr always does).
+        """
+        if self.fbank_backend == "numpy":
+            return self._fbank_numpy(waveform)
+
+        # Scale to int16 range in float32 (no float64 temporary for any input dtype)
+        waveform = np.multiply(waveform, INT16_RANGE, dtype=np.float32)
         fbank_fn = knf.OnlineFbank(self.opts)
-        fbank_fn.accept_waveform(self.opts.frame_opts.samp_freq, waveform.tolist())
+        samples = waveform if self._knf_accepts_ndarray else waveform.tolist()
+        fbank_fn.accept_waveform(self.opts.frame_opts.samp_freq, samples)
         frames = fbank_fn.num_frames_ready
-        mat = np.empty([frames, self.opts.mel_opts.num_bins])
-        for i in range(frames):
-            mat[i, :] = fbank_fn.get_frame(i)
-        feat = mat.astype(np.float32)
+
+        # Reusable float32 output buffer, grown only on a new high-water mark
+        if self._feat_buf is None or self._feat_buf.shape[0] < frames:
+            capacity = max(frames, 2 * (0 if self._feat_buf is None else self._feat_buf.shape[0]))
+            self._feat_buf = np.empty((capacity, self.opts.mel_opts.num_bins), dtype=np.float32)
+        feat = self._feat_buf[:frames]
+
+        # Pull all frames in one pass directly into float32 (no float64 staging buffer)
+        if frames:
+            get_frame = fbank_fn.get_frame
+            feat[:] = [get_frame(i) for i in range(frames)]
         return feat
 
+    def _fbank_numpy(self, waveform: np.ndarray) -> np.ndarray:
+        """
+        Extract fbank features with vectorized NumPy (no per-frame Python calls).
+        Mirrors the knf pipeline: DC removal, pre-emphasis, Hamming window,
+        power spectrum, Kaldi mel banks and log.
+        """
+        x = np.asarray(waveform, dtype=np.float32) * INT16_RANGE
+        num_bins = self._mel_banks_t.shape[1]
+        if len(x) < self._win_len:
+            return np.empty((0, num_bins), dtype=np.float32)
+
+        # Frame with snip_edges=True semantics
+        frames = np.lib.stride_tricks.sliding_window_view(x, self._win_len)[::self._win_shift].copy()
+        frames -= frames.mean(axis=1, keepdims=True)
+        frames[:, 1:] -= KALDI_PREEMPH_COEFF * frames[:, :-1]
+        frames[:, 0] *= 1.0 - KALDI_PREEMPH_COEFF
+        frames *= self._window
+
+        spectrum = np.fft.rfft(frames, n=self._n_fft, axis=1)[:, :self._n_fft // 2]
+        power = (spectrum.real ** 2 + spectrum.imag ** 2).astype(np.float32)
+
+        mel = power @ self._mel_banks_t
+        np.maximum(mel, KALDI_LOG_EPS, out=mel)
+        return np.log(mel, out=mel)
+
     def apply_lfr(self, inputs: np.ndarray, lfr_m: int, lfr_n: int) -> np.ndarray:
         """Apply Low Frame Rate processing"""
-        LFR_inputs = []
-        T = inputs.shape[0]
+        T, dim = inputs.shape
         T_lfr = int(np.ceil(T / lfr_n))
-        left_padding = np.tile(inputs[0], ((lfr_m - 1) // 2, 1))
-        inputs = np.vstack((left_padding, inputs))
-        T = T + (lfr_m - 1) // 2
-
-        for i in range(T_lfr):
-            if lfr_m <= T - i * lfr_n:
-                LFR_inputs.append((inputs[i * lfr_n : i * lfr_n + lfr_m]).reshape(1, -1))
-            else:
-                # process last LFR frame
-                num_padding = lfr_m - (T - i * lfr_n)
-                frame = inputs[i * lfr_n :].reshape(-1)
-                for _ in range(num_padding):
-                    frame = np.hstack((frame, inputs[-1]))
-                LFR_inputs.append(frame)
-
-        LFR_outputs = np.vstack(LFR_inputs).astype(np.float32)
+        num_left = (lfr_m - 1) // 2
+        # Right-pad with the last frame so every LFR window is complete
+        # (equivalent to padding the final partial window individually)
+        num_right = max(0, (T_lfr - 1) * lfr_n + lfr_m - (T + num_left))
+        padded = np.pad(
+            np.asarray(inputs, dtype=np.float32), ((num_left, num_right), (0, 0)), mode='edge'
+        )
+
+        # View each window of lfr_m frames (stepping lfr_n) as one flat row
+        windows = np.lib.stride_tricks.as_strided(
+            padded,
+            shape=(T_lfr, lfr_m * dim),
+            strides=(lfr_n * padded.strides[0], padded.strides[1]),
+            writeable=False
+        )
+        # Always copy: with a single LFR frame the strided view is already contiguous,
+        # and apply_cmvn writes into the result in place
+        LFR_outputs = windows.copy()
         return LFR_outputs
 
     def apply_cmvn(self, inputs: np.ndarray) -> np.ndarray:
-        """Apply CMVN normalization"""
+        """Apply CMVN normalization (in place on `inputs`)"""
         if self.cmvn is None:
             return inputs
 
-        frame, dim = inputs.shape
-        means = np.tile(self.cmvn[0:1, :dim], (frame, 1))
-        vars = np.tile(self.cmvn[1:2, :dim], (frame, 1))
-        inputs = (inputs + means) * vars
+        dim = inputs.shape[1]
+        # Broadcast the per-dimension vectors in place (no (frames, dim) temporaries)
+        np.add(inputs, self._neg_mean[:dim], out=inputs)
+        np.multiply(inputs, self._inv_std[:dim], out=inputs)
         return inputs
 
+    def samples_for_lfr_frames(self, num_lfr_frames: int) -> int:
+        """Number of input samples that fully determine the first num_lfr_frames LFR frames"""
+        frame_opts = self.opts.frame_opts
+        frame_len = int(frame_opts.samp_freq * frame_opts.frame_length_ms / 1000)
+        frame_shift = int(frame_opts.samp_freq * frame_opts.frame_shift_ms / 1000)
+        # Last LFR frame spans fbank rows up to (n-1)*lfr_n + lfr_m, minus the left padding
+        num_fbank = (num_lfr_frames - 1) * self.lfr_n + self.lfr_m - (self.lfr_m - 1) // 2
+        return frame_len + (num_fbank - 1) * frame_shift
+
     def get_features(self, inputs: np.ndarray) -> np.ndarray:
         """Complete feature extraction pipeline"""
         fbank = self.fbank(inputs)
@@ -98,8 +229,7 @@ class WavFrontend:
         return feats
 
     def load_cmvn(self) -> np.ndarray:
-        """Load CMVN parameters"""
-        from pathlib import Path
+        """Load CMVN parameters as a float32 (2, dim) array"""
         with open(self.cmvn_file, "r", encoding="utf-8") as f:
             lines = f.readlines()
 
@@ -120,9 +250,10 @@ class WavFrontend:
                     vars_list = list(rescale_line)
                     continue
 
-        means = np.array(means_list).astype(np.float64)
-        vars = np.array(vars_list).astype(np.float64)
-        cmvn = np.array([means, vars])
+        # Parse straight into float32 (the feature dtype; no float64 stage)
+        means = np.fromiter(means_list, dtype=np.float32, count=len(means_list))
+        vars = np.fromiter(vars_list, dtype=np.float32, count=len(vars_list))
+        cmvn = np.stack([means, vars])
         return cmvn
 
 class AudioProcessor:
@@ -134,19 +265,50 @@ class AudioProcessor:
         self.device_rate = None
         self.frontend = None
         self.embedding = None
+        self._query_cache = {}  # (language, use_itn) -> (1, 4, D) query prefix
+        self._language_queries = {}  # Pre-sliced embedding rows (set in load_embeddings)
+        self._text_norm_queries = {}
+        self._event_emo_query = None
         self._last_resample_used = None
+        self._resample_ratio = None  # (up, down) for device_rate -> model_rate
+        self._resample_filter = None  # Prebuilt polyphase FIR (scipy path)
+        self._resample_taps = None  # Padded, gain-applied taps for upfirdn
+        self._resample_taps_i16 = None  # Same, with int16 -> [-1, 1] scaling folded in
+        self._resample_skip = 0  # Leading outputs dropped to align with the input
+        self._resample_fn = None  # Resampler chosen once per rate pair
+        self._f32_buf = None  # Scratch buffer for int16 -> float32 VAD conversion
+        self._entropy_bins = 0  # Spectrum size the cached entropy normalizer is for
+        self._decim_buf = None  # Scratch for the block-averaged entropy input
+        self._inv_max_entropy = 0.0
+
+        # Rotating pool of preallocated RKNN input tensors. A returned tensor may
+        # still sit in the inference queue while later chunks are prepared, so
+        # the pool covers the queue depth plus the in-flight and in-progress chunks.
+        self._input_pool_size = config.get('pipeline_inference_queue_size', 2) + 2
+        self._input_pool = []
+        self._input_pool_rows = []  # Rows written by the last use of each tensor
+        self._input_pool_query = []  # Cached query prefix each tensor currently holds
+        self._input_pool_idx = 0
         
         # VAD parameters from config
         self.vad_energy_threshold = 0.01  # Will be calibrated
+        self.rms_margin = config.get('rms_margin', 0.004)  # Added to the noise floor
         self.vad_zcr_min = config.get('vad_zcr_min', 0.02)
         self.vad_zcr_max = config.get('vad_zcr_max', 0.35)
         self.vad_entropy_max = config.get('vad_entropy_max', 0.85)
+        # Entropy only needs the coarse spectral shape; FFT a block-averaged signal
+        self.vad_entropy_decimation = max(1, int(config.get('vad_entropy_decimation', 1)))
         self.enable_vad = config.get('enable_vad', True)
         self.vad_mode = config.get('vad_mode', 'accurate')  # 'fast' or 'accurate'
+        # Margin below the energy threshold at which a raw window is rejected unseen
+        self.vad_fast_reject_ratio = config.get('vad_fast_reject_ratio', 0.9)
 
         # Initialize frontend
         self._init_frontend()
 
+        # Compile (or load cached) numba kernels now, not on the first chunk
+        audio_kernels.warmup()
+
     def _init_frontend(self) -> None:
         """Initialize the audio frontend"""
         from pathlib import Path
@@ -154,9 +316,12 @@ class AudioProcessor:
         self.frontend = WavFrontend(
             cmvn_file=cmvn_path if cmvn_path.exists() else None,
             fs=self.model_rate,
-            n_mels=self.config['mel_bins']
+            n_mels=self.config['mel_bins'],
+            fbank_backend=self.config.get('fbank_backend', 'knf')
         )
-        logger.info("✅ Audio frontend initialized")
+        # Audio beyond this never reaches the fixed-size RKNN input
+        self._max_feature_samples = self.frontend.samples_for_lfr_frames(RKNN_INPUT_LEN - NUM_QUERY_ROWS)
+        logger.info(f"✅ Audio frontend initialized (fbank backend: {self.frontend.fbank_backend})")
 
     def load_embeddings(self, embedding_path: str) -> bool:
         """Load language and task embeddings"""
@@ -166,48 +331,174 @@ class AudioProcessor:
                 logger.error(f"❌ Embedding file not found: {embedding_path}")
                 return False
 
-            self.embedding = np.load(embedding_path)
+            self.embedding = np.load(embedding_path).astype(np.float32, copy=False)
+            self._slice_query_embeddings()
+            self._init_input_pool(self.embedding.shape[-1])
             logger.info(f"✅ Embeddings loaded: {self.embedding.shape}")
             return True
         except Exception as e:
             logger.error(f"❌ Failed to load embeddings: {e}")
             return False
 
+    def _slice_query_embeddings(self) -> None:
+        """Pre-slice the query embedding rows as (1, n, D) views (no fancy indexing per call)"""
+        emb = self.embedding[None, :, :]
+        self._language_queries = {name: emb[:, idx:idx + 1] for name, idx in LANGUAGES.items()}
+        # 14 means with itn, 15 means without itn
+        self._text_norm_queries = {True: emb[:, 14:15], False: emb[:, 15:16]}
+        self._event_emo_query = emb[:, 1:3]
+        self._query_cache.clear()
+
+    def _init_input_pool(self, feature_dim: int) -> None:
+        """Allocate the zero-filled RKNN input tensors"""
+        self._input_pool = [
+            np.zeros((1, RKNN_INPUT_LEN, feature_dim), dtype=np.float32)
+            for _ in range(self._input_pool_size)
+        ]
+        self._input_pool_rows = [0] * self._input_pool_size
+        self._input_pool_query = [None] * self._input_pool_size
+        self._input_pool_idx = 0
+
     def set_device_rate(self, rate: int) -> None:
         """Set the device sample rate for resampling"""
         self.device_rate = rate
         logger.info(f"🎛️ Device rate set to {self.device_rate} Hz; model rate = {self.model_rate} Hz")
-
-    def resample_to_model_rate(self, audio_data: np.ndarray) -> np.ndarray:
-        """Resample audio data to model rate (16kHz)"""
-        if self.device_rate == self.model_rate or self.device_rate is None:
-            return audio_data.astype(np.float32) / 32768.0
+        self._init_resampler()
+
+    def _init_resampler(self) -> None:
+        """Pick the resampler and design its filter once for the fixed rate pair"""
+        self._resample_ratio = None
+        self._resample_filter = None
+        self._resample_fn = None
+        if self.device_rate is None or self.device_rate == self.model_rate:
+            return
+
+        if upfirdn is not None:
+            from math import gcd
+            g = gcd(self.model_rate, self.device_rate)
+            up, down = self.model_rate // g, self.device_rate // g
+            # Same design as scipy.signal.resample_poly's default filter
+            max_rate = max(up, down)
+            half_len = 10 * max_rate
+            self._resample_filter = firwin(
+                2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0)
+            ).astype(np.float32)
+            self._resample_ratio = (up, down)
+
+            # Gain and leading zero-pad applied once, as resample_poly does per call,
+            # so output sample 0 lands on input sample 0 after dropping _resample_skip
+            n_pre_pad = down - half_len % down
+            taps = np.concatenate([np.zeros(n_pre_pad, dtype=np.float32),
+                                   self._resample_filter * np.float32(up)])
+            self._resample_taps = taps
+            # int16 variant folds in the 1/32768 scaling (no separate float32 pass)
+            self._resample_taps_i16 = taps * INT16_SCALE
+            self._resample_skip = (half_len + n_pre_pad) // down
+            logger.info(f"🎛️ Polyphase resampler ready: up={up}, down={down}, "
+                        f"taps={len(self._resample_filter)}")
+            self._resample_fn = self._polyphase_resample
+            self._last_resample_used = "polyphase"
+            return
+        logger.info("scipy not available, resampling with soxr/librosa")
 
         try:
-            # Try soxr first (higher quality)
+            # Try soxr next (higher quality)
             import soxr
-            x = audio_data.astype(np.float32) / 32768.0
-            y = soxr.resample(x, self.device_rate, self.model_rate)
+            self._resample_fn = lambda x: soxr.resample(
+                self.to_float32(x), self.device_rate, self.model_rate)
             self._last_resample_used = "soxr"
-            return y
         except ImportError:
             # Fallback to librosa
             import librosa
-            x = audio_data.astype(np.float32) / 32768.0
-            y = librosa.resample(y=x, orig_sr=self.device_rate, target_sr=self.model_rate, res_type="kaiser_fast")
+            self._resample_fn = lambda x: librosa.resample(
+                y=self.to_float32(x), orig_sr=self.device_rate, target_sr=self.model_rate,
+                res_type="kaiser_fast")
             self._last_resample_used = "librosa"
-            return y
+
+    def _polyphase_resample(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Polyphase FIR resampling with the prebuilt taps (equivalent to resample_poly).
+        int16 input is filtered directly and comes out as float32 in [-1.0, 1.0].
+        """
+        if audio_data.dtype == np.int16:
+            taps = self._resample_taps_i16
+        else:
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+            taps = self._resample_taps
+        up, down = self._resample_ratio
+        n_out = -(-len(audio_data) * up // down)
+        start = self._resample_skip
+        y = upfirdn(taps, audio_data, up, down)[start:start + n_out]
+        if len(y) < n_out:
+            # Trailing outputs past the filter support are zero
+            y = np.concatenate([y, np.zeros(n_out - len(y), dtype=y.dtype)])
+        return y
+
+    @staticmethod
+    def to_float32(audio_data: np.ndarray) -> np.ndarray:
+        """
+        Normalize audio to float32 in [-1.0, 1.0] with a single conversion pass.
+        int16 input is cast and scaled in one ufunc loop; float32 input is returned as-is.
+        """
+        if audio_data.dtype == np.int16:
+            return np.multiply(audio_data, INT16_SCALE, dtype=np.float32)
+        return np.asarray(audio_data, dtype=np.float32)
+
+    def resample_to_model_rate(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Resample audio data to model rate (16kHz).
+        Returns float32 in [-1.0, 1.0]; all downstream stages reuse this buffer.
+        """
+        if self.device_rate == self.model_rate or self.device_rate is None:
+            return self.to_float32(audio_data)
+
+        if self._resample_fn is None:
+            self._init_resampler()
+        # Resamplers take the raw buffer and normalize as part of their own pass
+        return self._resample_fn(audio_data)
+
+    def fingerprint(self, audio_data: np.ndarray) -> int:
+        """
+        Compute a 64-bit integer fingerprint of audio samples for deduplication.
+        Hashes the whole window (seeded with its length): a hit skips inference
+        for the window, so it must only match identical audio.
+        """
+        n = len(audio_data)
+        buf = memoryview(np.ascontiguousarray(audio_data)).cast('B')
+        if xxhash is not None:
+            return xxhash.xxh3_64_intdigest(buf, seed=n)
+        # Fallback to stdlib BLAKE2 (still much faster than MD5)
+        digest = hashlib.blake2b(buf, digest_size=8, salt=n.to_bytes(8, 'little')).digest()
+        return int.from_bytes(digest, 'little')
+
+    def _as_float32(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Normalize audio to float32 once per VAD decision.
+        int16 input is scaled into a reused scratch buffer, so the result is only
+        valid until the next call.
+        """
+        if audio_data.dtype == np.float32:
+            return audio_data
+        if audio_data.dtype != np.int16:
+            return np.asarray(audio_data, dtype=np.float32)
+        n = audio_data.size
+        if self._f32_buf is None or self._f32_buf.size < n:
+            self._f32_buf = np.empty(n, dtype=np.float32)
+        out = self._f32_buf[:n]
+        np.multiply(audio_data, INT16_SCALE, out=out, casting='unsafe')
+        return out
 
     def calculate_rms(self, audio_data: np.ndarray) -> float:
         """Calculate RMS of audio data (optimized)"""
-        # Use float32 directly to avoid double conversion
         if audio_data.dtype == np.int16:
-            # Vectorized normalization
-            x = audio_data.astype(np.float32) * (1.0 / 32768.0)
-        else:
-            x = audio_data.astype(np.float32)
-        # Use np.square for better performance than x * x
-        return float(np.sqrt(np.mean(np.square(x)) + 1e-12))
+            return int16_rms(audio_data)
+        return self._rms(self.to_float32(audio_data))
+
+    @staticmethod
+    def _rms(x: np.ndarray) -> float:
+        """RMS of normalized float32 audio"""
+        # Dot product reduces without materializing the squared array
+        return float(np.sqrt(np.dot(x, x) / len(x) + 1e-12))
 
     def calculate_zero_crossing_rate(self, audio_data: np.ndarray) -> float:
         """
@@ -215,19 +506,25 @@ class AudioProcessor:
         Higher ZCR typically indicates unvoiced speech or noise.
         Lower ZCR typically indicates voiced speech.
         """
-        if len(audio_data) < 2:
-            return 0.0
-        
-        # Vectorized ZCR calculation - avoid intermediate arrays
         if audio_data.dtype == np.int16:
-            x = audio_data.astype(np.float32) * (1.0 / 32768.0)
-        else:
-            x = audio_data.astype(np.float32)
-        
-        # Fast zero-crossing: count where adjacent samples have different signs
-        # Using x[:-1] * x[1:] < 0 is faster than sign + diff
-        crossings = np.sum(x[:-1] * x[1:] < 0)
-        return float(crossings / len(x))
+            # Sign test works on the raw samples; no float conversion needed
+            return AudioProcessor._sign_change_rate(audio_data < 0)
+        return self._zcr(self.to_float32(audio_data))
+
+    @staticmethod
+    def _zcr(x: np.ndarray) -> float:
+        """Zero-crossing rate of normalized float32 audio"""
+        # Same `< 0` test as the int16 path and the numba kernel (-0.0 is not negative)
+        return AudioProcessor._sign_change_rate(x < 0)
+
+    @staticmethod
+    def _sign_change_rate(sign: np.ndarray) -> float:
+        """Fraction of adjacent sign-bit flips (1 byte/sample, no float products)"""
+        n = len(sign)
+        if n < 2:
+            return 0.0
+        crossings = np.count_nonzero(np.not_equal(sign[1:], sign[:-1]))
+        return float(crossings / n)
 
     def calculate_spectral_entropy(self, audio_data: np.ndarray) -> float:
         """
@@ -235,35 +532,79 @@ class AudioProcessor:
         Lower entropy indicates tonal/speech content.
         Higher entropy indicates noise or silence.
         """
-        if len(audio_data) < 2:
-            return 1.0
-        
         # Ensure float32 (faster FFT than float64)
-        if audio_data.dtype == np.int16:
-            x = audio_data.astype(np.float32) * (1.0 / 32768.0)
-        else:
-            x = audio_data.astype(np.float32)
-        
+        return self._entropy(self.to_float32(audio_data))
+
+    def _entropy(self, x: np.ndarray) -> float:
+        """Normalized spectral entropy of float32 audio"""
+        if len(x) < 2:
+            return 1.0
+
+        d = self.vad_entropy_decimation
+        if d > 1 and len(x) >= 2 * d:
+            # Average groups of d samples, then FFT 1/d the points. The boxcar is a weak
+            # low-pass (~-13 dB sidelobes): high-band energy still aliases into the
+            # kept band, so the entropy differs from the full-rate value
+            m = len(x) // d
+            if self._decim_buf is None or self._decim_buf.size < m:
+                self._decim_buf = np.empty(m, dtype=np.float32)
+            out = self._decim_buf[:m]
+            np.mean(x[:m * d].reshape(m, d), axis=1, out=out)
+            x = out
+
         # Compute power spectrum using rfft (real FFT is 2x faster)
-        fft = np.fft.rfft(x)
-        # Use absolute + square separately is faster than abs**2
-        power_spectrum = np.square(np.abs(fft))
+        spectrum = rfft(x)
+        # |X|^2 in one pass over the (re, im) pairs, no sqrt or per-component temporaries
+        parts = spectrum.view(spectrum.real.dtype).reshape(-1, 2)
+        psd = np.einsum('ij,ij->i', parts, parts)
         
-        # Add epsilon and normalize in one step
+        # Normalize in place to a probability distribution
         eps = 1e-12
-        psd = power_spectrum / (np.sum(power_spectrum) + eps)
+        psd /= np.sum(psd) + eps
         
-        # Vectorized entropy calculation
-        # Only compute log where psd > 0 to avoid unnecessary operations
-        mask = psd > eps
-        entropy = -np.sum(psd[mask] * np.log2(psd[mask]))
+        # Entropy as one fused multiply-accumulate; eps keeps log finite for
+        # empty bins (0 * log(eps) = 0), so no mask/gather is needed
+        log_psd = psd + eps
+        np.log(log_psd, out=log_psd)
+        entropy = -np.dot(psd, log_psd)
         
-        # Normalize by maximum possible entropy
-        max_entropy = np.log2(np.sum(mask))  # Use actual non-zero count
-        normalized_entropy = entropy / max_entropy if max_entropy > 0 else 1.0
+        # Normalize by maximum possible entropy (natural log cancels the base);
+        # the window size is fixed at runtime, so 1/log(bins) is computed once
+        if psd.size != self._entropy_bins:
+            self._entropy_bins = psd.size
+            self._inv_max_entropy = 1.0 / np.log(psd.size) if psd.size > 1 else 0.0
+        if self._inv_max_entropy == 0.0:
+            return 1.0
+        normalized_entropy = entropy * self._inv_max_entropy
         
         return float(normalized_entropy)
 
+    def _energy_threshold(self, noise_floor: Optional[float]) -> float:
+        """RMS a window must exceed to count as possible speech"""
+        if noise_floor is not None:
+            return noise_floor + self.rms_margin
+        return self.vad_energy_threshold
+
+    def fast_reject(self, audio_data: np.ndarray, noise_floor: float = None) -> bool:
+        """
+        Cheap silence check on the raw device-rate window, before the VAD features.
+        Resampling only removes energy (anti-alias low-pass), so a window whose raw
+        RMS is clearly below the VAD energy threshold would be rejected anyway.
+        The raw RMS is not on the model-rate scale, so callers must not feed it
+        to the adaptive noise floor.
+        
+        Args:
+            audio_data: Raw window (int16 or float32) at the device rate
+            noise_floor: Calibrated noise floor RMS, if available
+            
+        Returns:
+            bool: True if the window is clearly silent (skip VAD and inference)
+        """
+        if self.vad_fast_reject_ratio <= 0 or len(audio_data) == 0:
+            return False
+        rms = self.calculate_rms(audio_data)
+        return rms < self.vad_fast_reject_ratio * self._energy_threshold(noise_floor)
+
     def is_speech_segment(self, audio_data: np.ndarray, noise_floor: float = None) -> Tuple[bool, Dict[str, float]]:
         """
         Advanced Voice Activity Detection (VAD) using multiple features.
@@ -272,16 +613,20 @@ class AudioProcessor:
         Returns:
             Tuple of (is_speech: bool, metrics: dict)
         """
+        # Normalize once; every feature below reads the same float32 samples
+        x = self._as_float32(audio_data)
+
         # Calculate base features (always needed, very fast)
-        rms = self.calculate_rms(audio_data)
-        
-        # Energy-based detection with adaptive threshold
-        if noise_floor is not None:
-            energy_threshold = noise_floor + self.config.get('rms_margin', 0.004)
+        zcr = None
+        if fused_rms_zcr is not None and len(x) >= 2:
+            # One native pass yields both RMS and ZCR
+            rms, zcr = fused_rms_zcr(x)
+            rms, zcr = float(rms), float(zcr)
         else:
-            energy_threshold = self.vad_energy_threshold
+            rms = self._rms(x)
         
-        energy_check = rms > energy_threshold
+        # Energy-based detection with adaptive threshold
+        energy_check = rms > self._energy_threshold(noise_floor)
         
         # Early exit if energy is too low (saves ZCR/FFT computation)
         if not energy_check:
@@ -296,7 +641,8 @@ class AudioProcessor:
             }
         
         # Calculate ZCR (fast, ~0.2ms)
-        zcr = self.calculate_zero_crossing_rate(audio_data)
+        if zcr is None:
+            zcr = self._zcr(x)
         zcr_check = self.vad_zcr_min < zcr < self.vad_zcr_max
         
         # Fast mode: Skip expensive FFT calculation
@@ -314,9 +660,14 @@ class AudioProcessor:
             }
             return is_speech, metrics
         
-        # Accurate mode: Add spectral entropy (expensive FFT, ~1ms)
-        spectral_entropy = self.calculate_spectral_entropy(audio_data)
-        entropy_check = spectral_entropy < self.vad_entropy_max
+        # Accurate mode: Add spectral entropy (expensive FFT, ~1ms) only when
+        # ZCR alone cannot decide; energy + ZCR already satisfies the rule below
+        if zcr_check:
+            spectral_entropy = -1.0  # Not calculated (ZCR decided)
+            entropy_check = True
+        else:
+            spectral_entropy = self._entropy(x)
+            entropy_check = spectral_entropy < self.vad_entropy_max
         
         # Combine checks - require energy + at least one other feature
         is_speech = energy_check and (zcr_check or entropy_check)
@@ -333,13 +684,56 @@ class AudioProcessor:
         
         return is_speech, metrics
 
+    def _get_query_prefix(self, language: str, use_itn: bool) -> np.ndarray:
+        """Get the cached language/event/text-norm query embeddings for a setting"""
+        key = (language, use_itn)
+        query = self._query_cache.get(key)
+        if query is None:
+            language_query = self._language_queries.get(language, self._language_queries['auto'])
+            query = np.ascontiguousarray(np.concatenate([
+                language_query,
+                self._event_emo_query,
+                self._text_norm_queries[bool(use_itn)],
+            ], axis=1), dtype=np.float32)
+            self._query_cache[key] = query
+        return query
+
+    def _fill_input_tensor(self, query: np.ndarray, speech_features: np.ndarray) -> np.ndarray:
+        """
+        Fill the next pooled (1, RKNN_INPUT_LEN, D) tensor with queries and scaled speech.
+        The tensor is reused after `_input_pool_size` calls, so callers must not retain it.
+        """
+        idx = self._input_pool_idx
+        self._input_pool_idx = (idx + 1) % self._input_pool_size
+        input_content = self._input_pool[idx]
+        rows = input_content[0]
+
+        n_query = query.shape[1]
+        end = n_query + min(speech_features.shape[0], RKNN_INPUT_LEN - n_query)
+        if self._input_pool_query[idx] is not query:
+            # Prefix rows only change with the language/ITN setting
+            rows[:n_query] = query[0]
+            self._input_pool_query[idx] = query
+        np.multiply(speech_features[:end - n_query], SPEECH_SCALE, out=rows[n_query:end])
+
+        # Only clear rows a previous, longer chunk left behind
+        prev_end = self._input_pool_rows[idx]
+        if prev_end > end:
+            rows[end:prev_end] = 0.0
+        self._input_pool_rows[idx] = end
+        return input_content
+
     def audio_to_features(self, audio_data: np.ndarray, language: str = 'auto',
                          use_itn: bool = True) -> Optional[np.ndarray]:
-        """Convert audio to SenseVoice features with query embeddings"""
+        """
+        Convert audio to SenseVoice features with query embeddings.
+        Expects float32 samples in [-1.0, 1.0] (output of resample_to_model_rate).
+        """
         try:
-            # Convert to float32 and normalize
-            if audio_data.dtype == np.int16:
-                audio_data = audio_data.astype(np.float32) / 32768.0
+            assert audio_data.dtype == np.float32, f"expected float32 audio, got {audio_data.dtype}"
+
+            # Skip feature extraction for samples that would be truncated anyway
+            audio_data = audio_data[:self._max_feature_samples]
 
             # Extract features using frontend
             speech_features = self.frontend.get_features(audio_data)
@@ -350,32 +744,13 @@ class AudioProcessor:
                 speech_features = speech_features[:max_frames, :]
 
             # Add language and text normalization queries
-            language_id = LANGUAGES.get(language, 0)  # Default to auto
-            language_query = self.embedding[[[language_id]]]
-
-            # 14 means with itn, 15 means without itn
-            text_norm_query = self.embedding[[[14 if use_itn else 15]]]
-            event_emo_query = self.embedding[[[1, 2]]]
+            query = self._get_query_prefix(language, use_itn)
 
-            # Scale the speech features
-            speech_features = speech_features[None, :, :].astype(np.float32) * SPEECH_SCALE
+            # Write queries + scaled speech features into a preallocated tensor
+            # (truncated to RKNN_INPUT_LEN; rows past the speech stay zero-padded)
+            input_content = self._fill_input_tensor(query, speech_features)
 
-            # Concatenate queries with speech features
-            input_content = np.concatenate([
-                language_query,
-                event_emo_query,
-                text_norm_query,
-                speech_features,
-            ], axis=1).astype(np.float32)
-
-            # Pad to RKNN_INPUT_LEN if needed
-            if input_content.shape[1] < RKNN_INPUT_LEN:
-                padding = RKNN_INPUT_LEN - input_content.shape[1]
-                input_content = np.pad(input_content, ((0, 0), (0, padding), (0, 0)), mode='constant')
-            elif input_content.shape[1] > RKNN_INPUT_LEN:
-                input_content = input_content[:, :RKNN_INPUT_LEN, :]
-
-            logger.debug(f"🎯 Model input shape: {input_content.shape}")
+            logger.debug("🎯 Model input shape: %s", input_content.shape)
 
             return input_content
 
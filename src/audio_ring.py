@@ -0,0 +1,141 @@
+"""
+Audio Ring
+==========
+Single-producer/single-consumer hand-off of capture blocks.
+
+Replaces `queue.Queue` between the audio callback and the worker: blocks are
+copied into fixed preallocated slots of one int16 array, and the two sides
+only advance their own index (plain int stores are atomic under the GIL), so
+no lock or per-block Python allocation sits on the real-time callback path.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRing:
+    """Fixed-slot SPSC ring of int16 audio blocks"""
+
+    def __init__(self, num_slots: int, slot_size: int):
+        """
+        Initialize audio ring.
+
+        Args:
+            num_slots: Number of blocks that can be buffered
+            slot_size: Maximum samples per block (frames * channels)
+        """
+        self._slots = np.empty((max(int(num_slots), 2), int(slot_size)), dtype=np.int16)
+        # Byte views of each slot so raw callback buffers copy in without an ndarray
+        self._slot_bytes = [memoryview(row).cast('B') for row in self._slots]
+        self._lengths = [0] * len(self._slots)
+        self._head = 0  # Written only by the producer
+        self._tail = 0  # Written only by the consumer
+        self._held = 0  # Slots the consumer still holds from the last read
+        self._data_ready = threading.Event()
+        self.dropped = 0
+
+    def write(self, block: np.ndarray) -> bool:
+        """
+        Copy a block into the next free slot (producer side).
+
+        Args:
+            block: int16 samples; truncated to the slot size
+
+        Returns:
+            bool: False if the ring was full and the block was dropped
+        """
+        slot = self._claim_slot()
+        if slot is None:
+            return False
+        n = min(len(block), self._slots.shape[1])
+        self._slots[slot, :n] = block[:n]
+        self._publish(slot, n)
+        return True
+
+    def write_bytes(self, data) -> bool:
+        """
+        Copy a raw native-endian int16 buffer into the next free slot (producer side).
+        Used from audio callbacks to avoid wrapping every block in an ndarray.
+
+        Args:
+            data: bytes-like object (bytes, memoryview, CFFI buffer)
+
+        Returns:
+            bool: False if the ring was full and the block was dropped
+        """
+        slot = self._claim_slot()
+        if slot is None:
+            return False
+        src = memoryview(data).cast('B')
+        nbytes = min(len(src), len(self._slot_bytes[slot])) & ~1
+        self._slot_bytes[slot][:nbytes] = src[:nbytes]
+        self._publish(slot, nbytes // 2)
+        return True
+
+    def _claim_slot(self) -> Optional[int]:
+        """Index of the next free slot, or None (block dropped) if the ring is full"""
+        if self._head - self._tail >= len(self._slots):
+            # Full (the slot at _tail may still be held by the consumer)
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(f"⚠️ Audio ring full, dropped {self.dropped} block(s)")
+            return None
+        return self._head % len(self._slots)
+
+    def _publish(self, slot: int, num_samples: int) -> None:
+        """Make a filled slot visible to the consumer"""
+        self._lengths[slot] = num_samples
+        self._head += 1
+        self._data_ready.set()
+
+    def read(self, timeout: float = 0.1, max_blocks: int = 1) -> Optional[np.ndarray]:
+        """
+        Get the next block(s) (consumer side).
+
+        Consecutive full slots are adjacent rows of one array, so up to
+        `max_blocks` queued blocks are returned as a single contiguous view
+        (stopping early at the ring wrap or after a short block).
+
+        Args:
+            timeout: Seconds to wait for data
+            max_blocks: Maximum number of queued blocks to return at once
+
+        Returns:
+            np.ndarray: View of the block(s), valid until the next read(); None on
+            timeout or wake()
+        """
+        if self._held:
+            # Release the slots handed out by the previous read
+            self._tail += self._held
+            self._held = 0
+
+        if self._tail == self._head:
+            self._data_ready.clear()
+            # Re-check after clearing so a write in between is not missed
+            if self._tail == self._head:
+                self._data_ready.wait(timeout)
+                if self._tail == self._head:
+                    return None
+
+        num_slots, slot_size = self._slots.shape
+        start = self._tail % num_slots
+        available = min(self._head - self._tail, max(max_blocks, 1), num_slots - start)
+        count, total = 1, self._lengths[start]
+        # Extend while the previous block filled its slot (no gap in the view)
+        while count < available and self._lengths[start + count - 1] == slot_size:
+            total += self._lengths[start + count]
+            count += 1
+
+        self._held = count
+        if count == 1:
+            return self._slots[start, :total]
+        return self._slots[start:start + count].reshape(-1)[:total]
+
+    def wake(self) -> None:
+        """Wake a consumer blocked in read()"""
+        self._data_ready.set()
@@ -1,15 +1,26 @@
 """
 Audio Stream Manager
 ====================
-Handles all PyAudio stream operations: device detection, initialization, 
+Handles all PyAudio/sounddevice stream operations: device detection, initialization, 
 sample rate detection, and audio data capture.
 """
 
+import json
 import logging
-import queue
+import math
+import os
 import numpy as np
 import pyaudio
 
+from audio_ring import AudioRing
+from thread_tuning import tune_current_thread
+
+try:
+    # Optional lower-overhead capture backend (same PortAudio device indices)
+    import sounddevice
+except (ImportError, OSError):
+    sounddevice = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,30 +37,79 @@ class AudioStreamManager:
         self.config = config
         self.audio = None
         self.stream = None
-        self.audio_queue = queue.Queue()
+        self.audio_ring = None  # Allocated once the channel count is known
+        # Ring holds this much audio; full ring drops blocks, so size it for the worst worker stall
+        self.ring_seconds = config.get('audio_ring_seconds', 10.0)
+        self.ring_blocks = config.get('audio_ring_blocks', 0)  # Explicit override (0 = from seconds)
         self.is_recording = False
+        self._callback_tuned = False  # Callback thread pinned on its first invocation
         
         # Audio settings from config
         self.chunk_size = config['chunk_size']
         self.audio_format = pyaudio.paInt16
         self.target_device = config.get('audio_device')
+        self.backend = config.get('audio_backend', 'pyaudio')
+        if self.backend == 'sounddevice' and sounddevice is None:
+            logger.warning("sounddevice not available, falling back to PyAudio capture")
+            self.backend = 'pyaudio'
         
         # Detected stream parameters
         self.device_rate = None
         self.channels = None
         self.device_index = None
+        
+        # Probed (rate, channels) per device name, persisted across restarts
+        self.device_cache_path = config.get('device_cache_path', '/app/logs/device_cache.json')
+        self._probe_cache = self._load_probe_cache()
 
-    def find_audio_device(self, device_name: str = None) -> int:
+    def _ring_slots(self) -> int:
+        """
+        Number of capture ring slots for the detected stream.
+
+        Returns:
+            int: audio_ring_blocks if set, else enough blocks for audio_ring_seconds
+        """
+        if self.ring_blocks > 0:
+            return self.ring_blocks
+        return max(math.ceil(self.ring_seconds * self.device_rate / self.chunk_size), 2)
+
+    def _load_probe_cache(self) -> dict:
+        """Load the persisted device probe results (empty if missing or unreadable)"""
+        if not self.device_cache_path:
+            return {}
+        try:
+            with open(self.device_cache_path) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_probe_cache(self) -> None:
+        """Persist the device probe results (best effort)"""
+        if not self.device_cache_path:
+            return
+        try:
+            tmp_path = self.device_cache_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self._probe_cache, f)
+            os.replace(tmp_path, self.device_cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write device cache: {e}")
+
+    def find_audio_device(self, device_name: str = None, audio: pyaudio.PyAudio = None) -> int:
         """
         Find audio device by name or return default.
         
         Args:
             device_name: Optional device name to search for
+            audio: Open PyAudio instance to reuse (a temporary one is created if None)
             
         Returns:
             int: Device index
         """
-        audio = pyaudio.PyAudio()
+        own_audio = audio is None
+        if own_audio:
+            audio = pyaudio.PyAudio()
 
         try:
             device_count = audio.get_device_count()
@@ -86,19 +146,23 @@ class AudioStreamManager:
             return target_device
 
         finally:
-            audio.terminate()
+            if own_audio:
+                audio.terminate()
 
-    def detect_sample_rate(self, device_index: int) -> int:
+    def detect_sample_rate(self, device_index: int, audio: pyaudio.PyAudio = None) -> int:
         """
         Auto-detect supported sample rate for device.
         
         Args:
             device_index: Device index to test
+            audio: Open PyAudio instance to reuse (a temporary one is created if None)
             
         Returns:
             int: Supported sample rate in Hz
         """
-        audio = pyaudio.PyAudio()
+        own_audio = audio is None
+        if own_audio:
+            audio = pyaudio.PyAudio()
 
         try:
             device_info = audio.get_device_info_by_index(device_index)
@@ -124,20 +188,33 @@ class AudioStreamManager:
             return default_rate
 
         finally:
-            audio.terminate()
+            if own_audio:
+                audio.terminate()
 
-    def pick_stream_params(self, device_index: int) -> tuple:
+    def pick_stream_params(self, device_index: int, audio: pyaudio.PyAudio = None) -> tuple:
         """
         Return supported (rate, channels) for device.
+        Results are cached per device name, so repeat starts skip the format probe.
         
         Args:
             device_index: Device index to test
+            audio: Open PyAudio instance to reuse (a temporary one is created if None)
             
         Returns:
             tuple: (sample_rate, channels)
         """
-        audio = pyaudio.PyAudio()
+        own_audio = audio is None
+        if own_audio:
+            audio = pyaudio.PyAudio()
         try:
+            info = audio.get_device_info_by_index(device_index)
+            device_key = info['name'].strip()
+            cached = self._probe_cache.get(device_key)
+            if isinstance(cached, list) and len(cached) == 2:
+                logger.info(f"Using cached stream params for '{device_key}': "
+                            f"{cached[0]} Hz, {cached[1]} ch")
+                return int(cached[0]), int(cached[1])
+
             rates = [16000, 48000, 44100, 32000, 22050, 8000]
             chans = [1, 2]
             for ch in chans:
@@ -148,18 +225,29 @@ class AudioStreamManager:
                             input_channels=ch, input_format=pyaudio.paInt16
                         )
                         logger.info(f"Device supports {r} Hz, {ch} ch")
+                        self._probe_cache[device_key] = [r, ch]
+                        self._save_probe_cache()
                         return r, ch
                     except ValueError:
                         continue
 
             # Fallback to device defaults
-            info = audio.get_device_info_by_index(device_index)
             r = int(info.get('defaultSampleRate', 48000))
             ch = 1 if info.get('maxInputChannels', 1) >= 1 else info.get('maxInputChannels', 1)
             logger.warning(f"Falling back to device defaults: {r} Hz, {ch} ch")
             return r, ch
         finally:
-            audio.terminate()
+            if own_audio:
+                audio.terminate()
+
+    def _forget_stream_params(self, device_index: int, audio: pyaudio.PyAudio) -> None:
+        """Drop a cached probe result that no longer opens, so the next start re-probes"""
+        try:
+            device_key = audio.get_device_info_by_index(device_index)['name'].strip()
+        except Exception:
+            return
+        if self._probe_cache.pop(device_key, None) is not None:
+            self._save_probe_cache()
 
     def audio_callback(self, in_data, frame_count, time_info, status):
         """
@@ -174,11 +262,34 @@ class AudioStreamManager:
         Returns:
             tuple: (data, continue_flag)
         """
+        if not self._callback_tuned:
+            self._tune_callback_thread()
         if self.is_recording:
-            audio_data = np.frombuffer(in_data, dtype=np.int16)
-            self.audio_queue.put(audio_data)
+            self.audio_ring.write_bytes(in_data)
         return (in_data, pyaudio.paContinue)
 
+    def raw_input_callback(self, indata, frames, time_info, status):
+        """
+        Audio input callback for sounddevice RawInputStream.
+
+        Args:
+            indata: CFFI buffer with raw int16 samples (only valid during the call)
+            frames: Number of frames
+            time_info: Timing information
+            status: Stream status flags
+        """
+        if not self._callback_tuned:
+            self._tune_callback_thread()
+        if self.is_recording:
+            # Copied into the ring slot before the buffer is reused
+            self.audio_ring.write_bytes(indata)
+
+    def _tune_callback_thread(self) -> None:
+        """Pin the native capture thread (created by PortAudio) to the fast cores"""
+        self._callback_tuned = True
+        tune_current_thread(self.config.get('capture_cpus'),
+                            rt_priority=self.config.get('capture_rt_priority'))
+
     def initialize_stream(self) -> bool:
         """
         Initialize PyAudio stream with auto-detected parameters.
@@ -186,36 +297,59 @@ class AudioStreamManager:
         Returns:
             bool: True if successful
         """
+        # One PortAudio session for all probing (and the PyAudio stream itself)
+        audio = None
         try:
+            audio = pyaudio.PyAudio()
+
             # Find audio device
-            self.device_index = self.find_audio_device(self.target_device)
+            self.device_index = self.find_audio_device(self.target_device, audio)
             if self.device_index is None:
                 logger.error("No suitable audio device found")
+                audio.terminate()
                 return False
 
             # Auto-detect sample rate and channels
-            detected_rate = self.detect_sample_rate(self.device_index)
-            self.device_rate, self.channels = self.pick_stream_params(self.device_index)
-
-            # Initialize PyAudio
-            self.audio = pyaudio.PyAudio()
-
-            # Open audio stream
-            self.stream = self.audio.open(
-                format=self.audio_format,
-                channels=self.channels,
-                rate=self.device_rate,
-                input=True,
-                input_device_index=self.device_index,
-                frames_per_buffer=self.chunk_size,
-                stream_callback=self.audio_callback
-            )
-
-            logger.info(f"Audio stream initialized: {self.device_rate} Hz, {self.channels} ch (Device {self.device_index})")
+            self.device_rate, self.channels = self.pick_stream_params(self.device_index, audio)
+            self.audio_ring = AudioRing(self._ring_slots(), self.chunk_size * self.channels)
+            self._callback_tuned = False  # New stream, new callback thread
+
+            if self.backend == 'sounddevice':
+                audio.terminate()
+                audio = None
+                # Open raw int16 stream (no per-callback bytes object)
+                self.stream = sounddevice.RawInputStream(
+                    samplerate=self.device_rate,
+                    channels=self.channels,
+                    dtype='int16',
+                    blocksize=self.chunk_size,
+                    device=self.device_index,
+                    callback=self.raw_input_callback
+                )
+            else:
+                self.audio = audio
+
+                # Open audio stream
+                self.stream = self.audio.open(
+                    format=self.audio_format,
+                    channels=self.channels,
+                    rate=self.device_rate,
+                    input=True,
+                    input_device_index=self.device_index,
+                    frames_per_buffer=self.chunk_size,
+                    stream_callback=self.audio_callback
+                )
+
+            logger.info(f"Audio stream initialized ({self.backend}): {self.device_rate} Hz, "
+                        f"{self.channels} ch (Device {self.device_index})")
             return True
 
         except Exception as e:
             logger.error(f"Failed to initialize audio stream: {e}")
+            if audio is not None and self.device_index is not None:
+                self._forget_stream_params(self.device_index, audio)
+            if audio is not None and self.audio is not audio:
+                audio.terminate()
             return False
 
     def start_recording(self) -> bool:
@@ -231,7 +365,10 @@ class AudioStreamManager:
                 return False
 
             self.is_recording = True
-            self.stream.start_stream()
+            if self.backend == 'sounddevice':
+                self.stream.start()
+            else:
+                self.stream.start_stream()
             logger.info("Audio recording started")
             return True
 
@@ -247,7 +384,10 @@ class AudioStreamManager:
 
         if self.stream:
             try:
-                self.stream.stop_stream()
+                if self.backend == 'sounddevice':
+                    self.stream.stop()
+                else:
+                    self.stream.stop_stream()
                 self.stream.close()
             except Exception as e:
                 logger.error(f"Error stopping stream: {e}")
@@ -260,20 +400,25 @@ class AudioStreamManager:
 
         logger.info("Audio recording stopped")
 
-    def get_audio_chunk(self, timeout: float = 0.1) -> np.ndarray:
+    def get_audio_chunk(self, timeout: float = 0.1, max_blocks: int = 1) -> np.ndarray:
         """
-        Get next audio chunk from queue.
+        Get next audio chunk from the capture ring.
         
         Args:
-            timeout: Queue timeout in seconds
+            timeout: Wait timeout in seconds
+            max_blocks: Drain up to this many queued capture blocks in one call
             
         Returns:
-            np.ndarray: Audio data or None if timeout
+            np.ndarray: Audio data (view valid until the next call) or None if timeout
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
+        if self.audio_ring is None:
             return None
+        return self.audio_ring.read(timeout, max_blocks)
+
+    def wake_consumer(self) -> None:
+        """Wake a consumer blocked in get_audio_chunk() (it receives None)"""
+        if self.audio_ring is not None:
+            self.audio_ring.wake()
 
     def get_stream_info(self) -> dict:
         """
@@ -6,20 +6,144 @@ Handles loading, validation, and management of application configuration.
 """
 
 import os
-from pathlib import Path
-from typing import Dict, Any
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+_VALID_LANGUAGES = frozenset({'auto', 'zh', 'en', 'yue', 'ja', 'ko', 'nospeech'})
+
+_TRUE_SET = frozenset({'true', '1', 'yes', 'on', 'y', 't'})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUE_SET
+
+
+def _parse_csv(value: str) -> list:
+    return value.split(',') if value else []
+
+
+def _parse_int_list(value: str) -> list:
+    return [int(c) for c in value.split(',') if c.strip()]
+
+
+# (environment variable, config key, converter)
+_ENV_MAPPINGS = (
+    ('CHUNK_DURATION', 'chunk_duration', float),
+    ('OVERLAP_DURATION', 'overlap_duration', float),
+    ('MODEL_PATH', 'model_path', str),
+    ('EMBEDDING_PATH', 'embedding_path', str),
+    ('BPE_PATH', 'bpe_path', str),
+    ('CMVN_PATH', 'cmvn_path', str),
+    ('VALIDATE_MODEL_SIZE', 'validate_model_size', _parse_bool),
+    ('FBANK_BACKEND', 'fbank_backend', str),
+    ('LANGUAGE', 'language', str),
+    ('USE_ITN', 'use_itn', _parse_bool),
+    ('AUDIO_DEVICE', 'audio_device', str),
+    ('AUDIO_BACKEND', 'audio_backend', str),
+    ('DEVICE_CACHE_PATH', 'device_cache_path', str),
+    ('AUDIO_RING_SECONDS', 'audio_ring_seconds', float),
+    ('AUDIO_RING_BLOCKS', 'audio_ring_blocks', int),
+    ('AUDIO_DRAIN_BLOCKS', 'audio_drain_blocks', int),
+    ('LOG_LEVEL', 'log_level', str),
+    ('WEBSOCKET_PORT', 'websocket_port', int),
+    ('ENABLE_BATCH_BROADCAST', 'enable_batch_broadcast', _parse_bool),
+    ('WEBSOCKET_HOST', 'websocket_host', str),
+    ('RMS_MARGIN', 'rms_margin', float),
+    ('NOISE_CALIB_SECS', 'noise_calib_secs', float),
+    ('MIN_CHARS', 'min_chars', int),
+    ('DUPLICATE_COOLDOWN_S', 'duplicate_cooldown_s', float),
+    ('SIMILARITY_THRESHOLD', 'similarity_threshold', float),
+    ('ENABLE_AUDIO_DEDUP', 'enable_audio_dedup', _parse_bool),
+    ('ENABLE_VAD', 'enable_vad', _parse_bool),
+    ('VAD_ZCR_MIN', 'vad_zcr_min', float),
+    ('VAD_ZCR_MAX', 'vad_zcr_max', float),
+    ('VAD_ENTROPY_MAX', 'vad_entropy_max', float),
+    ('VAD_ENTROPY_DECIMATION', 'vad_entropy_decimation', int),
+    ('VAD_FAST_REJECT_RATIO', 'vad_fast_reject_ratio', float),
+    ('ADAPTIVE_NOISE_FLOOR', 'adaptive_noise_floor', _parse_bool),
+    ('VAD_MODE', 'vad_mode', str),
+    ('FILTER_BGM', 'filter_bgm', _parse_bool),
+    ('FILTER_EVENTS', 'filter_events', _parse_csv),
+    ('SHOW_EMOTIONS', 'show_emotions', _parse_bool),
+    ('SHOW_EVENTS', 'show_events', _parse_bool),
+    ('SHOW_LANGUAGE', 'show_language', _parse_bool),
+    ('ENABLE_LANGUAGE_LOCK', 'enable_language_lock', _parse_bool),
+    ('LANGUAGE_LOCK_WARMUP_S', 'language_lock_warmup_s', float),
+    ('LANGUAGE_LOCK_MIN_SAMPLES', 'language_lock_min_samples', int),
+    ('LANGUAGE_LOCK_CONFIDENCE', 'language_lock_confidence', float),
+    ('ENABLE_CONFIDENCE_STITCHING', 'enable_confidence_stitching', _parse_bool),
+    ('CONFIDENCE_THRESHOLD', 'confidence_threshold', float),
+    ('OVERLAP_WORD_COUNT', 'overlap_word_count', int),
+    ('ENABLE_TIMELINE_MERGING', 'enable_timeline_merging', _parse_bool),
+    ('TIMELINE_OVERLAP_CONFIDENCE', 'timeline_overlap_confidence', float),
+    ('TIMELINE_MIN_WORD_CONFIDENCE', 'timeline_min_word_confidence', float),
+    ('TIMELINE_CONFIDENCE_REPLACEMENT', 'timeline_confidence_replacement', _parse_bool),
+    ('ENABLE_PUNCTUATION_RESTORATION', 'enable_punctuation_restoration', _parse_bool),
+    ('ENABLE_SPELLCHECK', 'enable_spellcheck', _parse_bool),
+    ('ENABLE_SEMANTIC_REFINEMENT', 'enable_semantic_refinement', _parse_bool),
+    ('SPELL_DICT_PATH', 'spell_dict_path', str),
+    ('PUNCTUATION_MIN_LENGTH', 'punctuation_min_length', int),
+    ('SPELLCHECK_CONFIDENCE_THRESHOLD', 'spellcheck_confidence_threshold', float),
+    ('ENABLE_PIPELINE_PARALLELIZATION', 'enable_pipeline_parallelization', _parse_bool),
+    ('PIPELINE_PREPROCESS_QUEUE_SIZE', 'pipeline_preprocess_queue_size', int),
+    ('PIPELINE_INFERENCE_QUEUE_SIZE', 'pipeline_inference_queue_size', int),
+    ('PIPELINE_POSTPROCESS_QUEUE_SIZE', 'pipeline_postprocess_queue_size', int),
+    ('PIPELINE_EMIT_QUEUE_SIZE', 'pipeline_emit_queue_size', int),
+    ('WORKER_CPUS', 'worker_cpus', _parse_int_list),
+    ('EMITTER_CPUS', 'emitter_cpus', _parse_int_list),
+    ('WORKER_NICE', 'worker_nice', int),
+    ('WORKER_RT_PRIORITY', 'worker_rt_priority', int),
+    ('CAPTURE_CPUS', 'capture_cpus', _parse_int_list),
+    ('CAPTURE_RT_PRIORITY', 'capture_rt_priority', int),
+)
+
+# Column views of _ENV_MAPPINGS for the snapshot/convert loops
+_ENV_NAMES = tuple(env_var for env_var, _, _ in _ENV_MAPPINGS)
+_ENV_TARGETS = tuple((config_key, converter) for _, config_key, converter in _ENV_MAPPINGS)
+
+# (snapshot of the watched variables, resulting overrides)
+_env_overrides_cache = None
+
+
+def _compute_env_overrides() -> Dict[str, Any]:
+    """
+    Convert the set environment variables into config overrides.
+    The result is cached and only recomputed when one of the watched
+    variables changes, so repeated ConfigManager() constructions are cheap.
+    """
+    global _env_overrides_cache
+    # map() drives the lookups from C; unset variables show up as None
+    snapshot = tuple(map(os.environ.get, _ENV_NAMES))
+    if _env_overrides_cache is not None and _env_overrides_cache[0] == snapshot:
+        return dict(_env_overrides_cache[1])
+
+    overrides = {}
+    for env_var, value, (config_key, converter) in zip(_ENV_NAMES, snapshot, _ENV_TARGETS):
+        if value is None:
+            continue
+        try:
+            overrides[config_key] = converter(value)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid value for {env_var}: {value}, using default")
+
+    _env_overrides_cache = (snapshot, overrides)
+    return dict(overrides)
+
 class ConfigManager:
     """Manages application configuration with validation"""
 
-    DEFAULT_CONFIG = {
+    # Read-only; each ConfigManager works on its own dict copy
+    DEFAULT_CONFIG = MappingProxyType({
         'sample_rate': 16000,
         'chunk_size': 1024,
         'channels': 1,
         'mel_bins': 80,
+        'fbank_backend': 'knf',  # 'knf' (kaldi-native-fbank) or 'numpy' (vectorized, Kaldi-compatible)
         'max_frames': 3000,
         'chunk_duration': 3.0,
         'overlap_duration': 1.5,
@@ -27,21 +151,31 @@ class ConfigManager:
         'embedding_path': '/app/models/sensevoice-rknn/embedding.npy',
         'bpe_path': '/app/models/sensevoice-rknn/chn_jpn_yue_eng_ko_spectok.bpe.model',
         'cmvn_path': '/app/models/sensevoice-rknn/am.mvn',
+        'validate_model_size': False,  # Sanity-check model file size (~485MB) at validation
         'language': 'auto',
         'use_itn': True,
         'audio_device': 'default',
+        'audio_backend': 'pyaudio',  # 'pyaudio' or 'sounddevice' (falls back to PyAudio if missing)
+        'device_cache_path': '/app/logs/device_cache.json',  # Cached stream params per device ('' = always probe)
+        'audio_ring_seconds': 10.0,  # Capture audio buffered for a stalled worker before blocks are dropped
+        'audio_ring_blocks': 0,  # Explicit capture ring size in blocks (0 = derive from audio_ring_seconds)
+        'audio_drain_blocks': 16,  # Max queued capture blocks the worker takes per read
         'log_level': 'INFO',
         'websocket_port': 8765,
+        'enable_batch_broadcast': False,  # Send multi-result emit batches as one JSON-array WebSocket frame (clients must accept arrays)
         'websocket_host': '0.0.0.0',
         'rms_margin': 0.004,
         'noise_calib_secs': 1.5,
         'min_chars': 3,
         'duplicate_cooldown_s': 4.0,
         'similarity_threshold': 0.85,  # Fuzzy matching threshold (0.0-1.0)
+        'enable_audio_dedup': True,  # Fingerprint chunks to skip re-decoding identical audio
         'enable_vad': True,  # Enable Voice Activity Detection
         'vad_zcr_min': 0.02,  # Minimum zero-crossing rate for speech
         'vad_zcr_max': 0.35,  # Maximum zero-crossing rate for speech
         'vad_entropy_max': 0.85,  # Maximum spectral entropy for speech
+        'vad_entropy_decimation': 1,  # Block-average factor before the entropy FFT (1 = full rate; >1 is cheaper but shifts entropy, retune vad_entropy_max)
+        'vad_fast_reject_ratio': 0.9,  # Skip VAD features when raw RMS < ratio * energy threshold (0 = off)
         'adaptive_noise_floor': True,  # Enable adaptive noise floor updates
         'vad_mode': 'accurate',  # 'fast' (RMS+ZCR, ~0.3ms) or 'accurate' (adds FFT, ~1.5ms)
         # SenseVoice metadata filtering options
@@ -76,15 +210,22 @@ class ConfigManager:
         'pipeline_preprocess_queue_size': 3,  # Preprocessing queue size (buffers audio chunks)
         'pipeline_inference_queue_size': 2,  # Inference queue size (buffers preprocessed features)
         'pipeline_postprocess_queue_size': 2,  # Postprocessing queue size (buffers inference results)
-        'pipeline_emit_queue_size': 10  # Emission queue size (buffers output for WebSocket/console)
-    }
+        'pipeline_emit_queue_size': 10,  # Emission queue size (buffers output for WebSocket/console)
+        # Thread placement (RK3588: cores 4-7 are Cortex-A76, 0-3 are Cortex-A55)
+        'worker_cpus': [4, 5, 6, 7],  # CPUs for compute threads (worker + pipeline stages)
+        'emitter_cpus': [0, 1],  # CPUs for the I/O-bound emitter thread
+        'worker_nice': -5,  # Nice value for compute threads (needs CAP_SYS_NICE, else ignored)
+        'worker_rt_priority': 0,  # SCHED_FIFO priority for the audio worker thread (0 = off, needs CAP_SYS_NICE)
+        'capture_cpus': [4, 5, 6, 7],  # CPUs for the audio capture callback thread
+        'capture_rt_priority': 0  # SCHED_FIFO priority for the capture callback thread (0 = off, needs CAP_SYS_NICE)
+    })
 
-    REQUIRED_FILES = [
+    REQUIRED_FILES = (
         'model_path',
         'embedding_path',
         'bpe_path',
         'cmvn_path'
-    ]
+    )
 
     def __init__(self):
         self.config = {}
@@ -92,69 +233,10 @@ class ConfigManager:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from environment variables and defaults"""
-        config = self.DEFAULT_CONFIG.copy()
-
-        # Override with environment variables
-        env_mappings = {
-            'CHUNK_DURATION': ('chunk_duration', float),
-            'OVERLAP_DURATION': ('overlap_duration', float),
-            'MODEL_PATH': ('model_path', str),
-            'EMBEDDING_PATH': ('embedding_path', str),
-            'BPE_PATH': ('bpe_path', str),
-            'CMVN_PATH': ('cmvn_path', str),
-            'LANGUAGE': ('language', str),
-            'USE_ITN': ('use_itn', lambda x: x.lower() == 'true'),
-            'AUDIO_DEVICE': ('audio_device', str),
-            'LOG_LEVEL': ('log_level', str),
-            'WEBSOCKET_PORT': ('websocket_port', int),
-            'WEBSOCKET_HOST': ('websocket_host', str),
-            'RMS_MARGIN': ('rms_margin', float),
-            'NOISE_CALIB_SECS': ('noise_calib_secs', float),
-            'MIN_CHARS': ('min_chars', int),
-            'DUPLICATE_COOLDOWN_S': ('duplicate_cooldown_s', float),
-            'SIMILARITY_THRESHOLD': ('similarity_threshold', float),
-            'ENABLE_VAD': ('enable_vad', lambda x: x.lower() == 'true'),
-            'VAD_ZCR_MIN': ('vad_zcr_min', float),
-            'VAD_ZCR_MAX': ('vad_zcr_max', float),
-            'VAD_ENTROPY_MAX': ('vad_entropy_max', float),
-            'ADAPTIVE_NOISE_FLOOR': ('adaptive_noise_floor', lambda x: x.lower() == 'true'),
-            'VAD_MODE': ('vad_mode', str),
-            'FILTER_BGM': ('filter_bgm', lambda x: x.lower() == 'true'),
-            'FILTER_EVENTS': ('filter_events', lambda x: x.split(',') if x else []),
-            'SHOW_EMOTIONS': ('show_emotions', lambda x: x.lower() == 'true'),
-            'SHOW_EVENTS': ('show_events', lambda x: x.lower() == 'true'),
-            'SHOW_LANGUAGE': ('show_language', lambda x: x.lower() == 'true'),
-            'ENABLE_LANGUAGE_LOCK': ('enable_language_lock', lambda x: x.lower() == 'true'),
-            'LANGUAGE_LOCK_WARMUP_S': ('language_lock_warmup_s', float),
-            'LANGUAGE_LOCK_MIN_SAMPLES': ('language_lock_min_samples', int),
-            'LANGUAGE_LOCK_CONFIDENCE': ('language_lock_confidence', float),
-            'ENABLE_CONFIDENCE_STITCHING': ('enable_confidence_stitching', lambda x: x.lower() == 'true'),
-            'CONFIDENCE_THRESHOLD': ('confidence_threshold', float),
-            'OVERLAP_WORD_COUNT': ('overlap_word_count', int),
-            'ENABLE_TIMELINE_MERGING': ('enable_timeline_merging', lambda x: x.lower() == 'true'),
-            'TIMELINE_OVERLAP_CONFIDENCE': ('timeline_overlap_confidence', float),
-            'TIMELINE_MIN_WORD_CONFIDENCE': ('timeline_min_word_confidence', float),
-            'TIMELINE_CONFIDENCE_REPLACEMENT': ('timeline_confidence_replacement', lambda x: x.lower() == 'true'),
-            'ENABLE_PUNCTUATION_RESTORATION': ('enable_punctuation_restoration', lambda x: x.lower() == 'true'),
-            'ENABLE_SPELLCHECK': ('enable_spellcheck', lambda x: x.lower() == 'true'),
-            'ENABLE_SEMANTIC_REFINEMENT': ('enable_semantic_refinement', lambda x: x.lower() == 'true'),
-            'SPELL_DICT_PATH': ('spell_dict_path', str),
-            'PUNCTUATION_MIN_LENGTH': ('punctuation_min_length', int),
-            'SPELLCHECK_CONFIDENCE_THRESHOLD': ('spellcheck_confidence_threshold', float),
-            'ENABLE_PIPELINE_PARALLELIZATION': ('enable_pipeline_parallelization', lambda x: x.lower() == 'true'),
-            'PIPELINE_PREPROCESS_QUEUE_SIZE': ('pipeline_preprocess_queue_size', int),
-            'PIPELINE_INFERENCE_QUEUE_SIZE': ('pipeline_inference_queue_size', int),
-            'PIPELINE_POSTPROCESS_QUEUE_SIZE': ('pipeline_postprocess_queue_size', int),
-            'PIPELINE_EMIT_QUEUE_SIZE': ('pipeline_emit_queue_size', int)
-        }
-
-        for env_var, (config_key, converter) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                try:
-                    config[config_key] = converter(value)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid value for {env_var}: {value}, using default")
+        config = dict(self.DEFAULT_CONFIG)
+
+        # Override with environment variables (scanned once per environment state)
+        config.update(_compute_env_overrides())
 
         self.config = config
         logger.info("✅ Configuration loaded successfully")
@@ -164,21 +246,23 @@ class ConfigManager:
         """Validate configuration and required files"""
         try:
             # Check required files exist
+            found = self._find_required_files()
             for file_key in self.REQUIRED_FILES:
-                file_path = Path(self.config[file_key])
-                if not file_path.exists():
-                    logger.error(f"❌ Required file not found: {file_path}")
+                entry = found[file_key]
+                if entry is None:
+                    logger.error(f"❌ Required file not found: {self.config[file_key]}")
                     return False
 
-                # Validate model file size (should be ~485MB)
-                if file_key == 'model_path':
-                    model_size = file_path.stat().st_size
+                # Validate model file size (should be ~485MB); opt-in, costs a stat()
+                if file_key == 'model_path' and self.config.get('validate_model_size', False):
+                    st = entry.stat() if isinstance(entry, os.DirEntry) else entry
+                    model_size = st.st_size
                     expected_size = 485 * 1024 * 1024  # ~485MB
                     if abs(model_size - expected_size) > expected_size * 0.1:  # 10% tolerance
                         logger.warning(f"⚠️ Model size unexpected: {model_size / 1024 / 1024:.1f}MB")
 
             # Validate language
-            if self.config['language'] not in ['auto', 'zh', 'en', 'yue', 'ja', 'ko', 'nospeech']:
+            if self.config['language'] not in _VALID_LANGUAGES:
                 logger.warning(f"⚠️ Unknown language: {self.config['language']}, defaulting to 'auto'")
                 self.config['language'] = 'auto'
 
@@ -198,13 +282,52 @@ class ConfigManager:
             logger.error(f"❌ Configuration validation failed: {e}")
             return False
 
+    def _find_required_files(self) -> Dict[str, Any]:
+        """
+        Look up the required files with one directory scan per parent directory.
+
+        Returns:
+            dict: Config key -> os.DirEntry (or os.stat_result on fallback), None if missing
+        """
+        by_dir = defaultdict(list)
+        for file_key in self.REQUIRED_FILES:
+            directory, name = os.path.split(self.config[file_key])
+            by_dir[directory or '.'].append((file_key, name))
+
+        found = {}
+        for directory, files in by_dir.items():
+            try:
+                with os.scandir(directory) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = None
+
+            for file_key, name in files:
+                if entries is not None:
+                    found[file_key] = entries.get(name)
+                    continue
+                # Directory not listable: fall back to a per-path stat()
+                try:
+                    found[file_key] = os.stat(self.config[file_key])
+                except OSError:
+                    found[file_key] = None
+        return found
+
     def get(self, key: str, default=None) -> Any:
         """Get configuration value"""
         return self.config.get(key, default)
 
-    def get_all(self) -> Dict[str, Any]:
-        """Get all configuration values"""
-        return self.config.copy()
+    def get_all(self, copy: bool = False) -> Mapping[str, Any]:
+        """
+        Get all configuration values.
+
+        Args:
+            copy: Return a mutable dict copy instead of a read-only view
+
+        Returns:
+            Mapping: Read-only live view of the configuration (or a dict copy)
+        """
+        return dict(self.config) if copy else MappingProxyType(self.config)
 
     def update(self, updates: Dict[str, Any]) -> None:
         """Update configuration values"""
@@ -14,8 +14,9 @@ with preprocessing and postprocessing, we maximize throughput.
 
 import logging
 import time
-from typing import Any, Optional, Dict
+from typing import Optional
 from pipeline_stage import PipelineStage
+from pipeline_types import PreprocessedChunk, InferenceResult
 
 logger = logging.getLogger(__name__)
 
@@ -24,23 +25,8 @@ class InferenceStage(PipelineStage):
     """
     Inference stage: NPU model execution.
     
-    Input: {
-        'mel_features': np.ndarray,
-        'audio_hash': str,
-        'vad_metrics': dict,
-        'language': str,
-        'use_itn': bool,
-        'chunk_counter': int
-    }
-    
-    Output: {
-        'npu_output': np.ndarray,
-        'audio_hash': str,
-        'language': str,
-        'use_itn': bool,
-        'chunk_counter': int,
-        'inference_time_ms': float
-    }
+    Input: PreprocessedChunk (RKNN input tensor + chunk metadata)
+    Output: InferenceResult (NPU output + chunk metadata + inference time)
     """
 
     def __init__(self, input_queue, output_queue, model_manager, statistics_tracker):
@@ -60,7 +46,7 @@ class InferenceStage(PipelineStage):
         
         logger.info("InferenceStage initialized")
 
-    def process(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def process(self, item: PreprocessedChunk) -> Optional[InferenceResult]:
         """
         Run NPU inference on preprocessed features.
         
@@ -68,36 +54,37 @@ class InferenceStage(PipelineStage):
             item: Preprocessed features from previous stage
             
         Returns:
-            Inference results dict or None if inference failed
+            Inference result or None if inference failed
         """
         try:
-            mel_features = item['mel_features']
-            audio_hash = item['audio_hash']
+            mel_features = item.mel_features
+            audio_hash = item.audio_hash
             
             # Run NPU inference (this is the bottleneck, ~50-100ms)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             npu_output = self.model_manager.run_inference(mel_features)
-            inference_time_ms = (time.time() - start_time) * 1000
+            inference_ns = time.perf_counter_ns() - start_ns
             
             if npu_output is None:
                 logger.warning(f"NPU inference returned None for hash {audio_hash}")
                 return None
             
             # Record statistics
-            self.statistics.record_inference(inference_time_ms)
+            self.statistics.record_inference(inference_ns)
             
-            logger.debug(f"🚀 NPU Inference: {inference_time_ms:.1f}ms | Hash: {audio_hash}")
+            logger.debug("🚀 NPU Inference: %.1fms | Hash: %s", inference_ns / 1e6, audio_hash)
             
-            # Pass results to next stage
-            return {
-                'npu_output': npu_output,
-                'audio_hash': audio_hash,
-                'language': item['language'],
-                'use_itn': item['use_itn'],
-                'chunk_counter': item['chunk_counter'],
-                'inference_time_ms': inference_time_ms,
-                'vad_metrics': item.get('vad_metrics', {})
-            }
+            # Pass results to next stage. The input tensor (a pooled buffer reused
+            # for later chunks) and the raw audio are not carried forward.
+            return InferenceResult(
+                npu_output=npu_output,
+                audio_hash=audio_hash,
+                language=item.language,
+                use_itn=item.use_itn,
+                chunk_counter=item.chunk_counter,
+                inference_time_ns=inference_ns,
+                vad_metrics=item.vad_metrics
+            )
             
         except Exception as e:
             logger.error(f"Inference error: {e}", exc_info=True)
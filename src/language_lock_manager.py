@@ -7,7 +7,7 @@ transcription performance for single-language sessions.
 
 import logging
 import time
-from collections import Counter
+from collections import Counter, deque
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,9 @@ class LanguageLockManager:
         'Cantonese': 'yue'
     }
 
+    # Case-insensitive lookup built once from LANGUAGE_CODE_MAP
+    _LANG_LOOKUP = {name.lower(): code for name, code in LANGUAGE_CODE_MAP.items()}
+
     def __init__(self, config: dict):
         """
         Initialize language lock manager.
@@ -42,8 +45,13 @@ class LanguageLockManager:
         # State
         self.current_language = self.initial_language
         self.locked = (self.initial_language != 'auto')  # Already locked if not auto
+        self._ignore_detections = (not self.enabled) or self.locked  # Fast-path flag for record_detection
         self.warmup_start = None
-        self.detections = []
+        self._warmup_deadline = None  # Monotonic time at which warmup ends
+        self._counts = Counter()  # Running per-language detection counts (authoritative)
+        self._total = 0
+        # Bounded diagnostic tail of the most recent detections
+        self.detections = deque(maxlen=max(self.min_samples * 10, 64))
         
         if self.enabled and not self.locked:
             logger.info(f"🌍 Language auto-lock enabled: will lock after {self.warmup_duration}s warmup")
@@ -55,7 +63,8 @@ class LanguageLockManager:
     def start_warmup(self) -> None:
         """Start the language detection warmup period"""
         if self.enabled and not self.locked and self.warmup_start is None:
-            self.warmup_start = time.time()
+            self.warmup_start = time.monotonic()
+            self._warmup_deadline = self.warmup_start + self.warmup_duration
             logger.info("🌍 Language detection warmup started")
 
     def record_detection(self, language_name: str) -> None:
@@ -65,7 +74,7 @@ class LanguageLockManager:
         Args:
             language_name: Full language name (e.g., 'English', 'Chinese')
         """
-        if not self.enabled or self.locked:
+        if self._ignore_detections:
             return
         
         # Start warmup on first detection
@@ -73,11 +82,13 @@ class LanguageLockManager:
             self.start_warmup()
         
         # Map language name to code
-        lang_code = self.LANGUAGE_CODE_MAP.get(language_name)
+        lang_code = self._LANG_LOOKUP.get(language_name.lower() if language_name else '')
         if not lang_code:
-            logger.debug(f"Unknown language name: {language_name}")
+            logger.debug("Unknown language name: %s", language_name)
             return
         
+        self._counts[lang_code] += 1
+        self._total += 1
         self.detections.append(lang_code)
         
         # Check if ready to lock
@@ -89,35 +100,36 @@ class LanguageLockManager:
             return
         
         # Check warmup duration
-        warmup_elapsed = time.time() - self.warmup_start
-        if warmup_elapsed < self.warmup_duration:
+        if time.monotonic() < self._warmup_deadline:
             return
         
         # Check minimum samples
-        if len(self.detections) < self.min_samples:
-            logger.info(f"⚠️ Insufficient samples ({len(self.detections)}/{self.min_samples}) "
+        if self._total < self.min_samples:
+            logger.info(f"⚠️ Insufficient samples ({self._total}/{self.min_samples}) "
                        f"after warmup, remaining in auto mode")
             self.locked = True  # Don't try again
+            self._ignore_detections = True
             return
         
-        # Calculate language distribution
-        lang_counts = Counter(self.detections)
-        total = len(self.detections)
-        most_common_lang, count = lang_counts.most_common(1)[0]
+        # Language distribution is maintained incrementally
+        total = self._total
+        most_common_lang, count = self._counts.most_common(1)[0]
         confidence = count / total
         
         # Check confidence threshold
         if confidence >= self.confidence_threshold:
             self.current_language = most_common_lang
             self.locked = True
+            self._ignore_detections = True
             logger.info(f"🔒 Language LOCKED to '{most_common_lang}' "
                        f"(confidence: {confidence:.1%}, samples: {count}/{total})")
-            logger.info(f"   Distribution: {dict(lang_counts)}")
+            logger.info(f"   Distribution: {dict(self._counts)}")
         else:
             logger.info(f"⚠️ Language detection inconclusive after warmup "
                        f"(best: {most_common_lang} at {confidence:.1%}), "
                        f"remaining in auto mode")
             self.locked = True  # Don't try again
+            self._ignore_detections = True
 
     def get_current_language(self) -> str:
         """
@@ -146,32 +158,41 @@ class LanguageLockManager:
         """
         return self.enabled
 
-    def get_status(self) -> dict:
+    def get_status_brief(self) -> dict:
         """
-        Get current language lock status.
+        Get the cheap subset of the language lock status (no clock read or
+        distribution), for frequent polling.
         
         Returns:
-            dict: Status information
+            dict: enabled, locked, current_language, detections_count
         """
-        status = {
+        return {
             'enabled': self.enabled,
             'locked': self.locked,
             'current_language': self.current_language,
-            'detections_count': len(self.detections)
+            'detections_count': self._total
         }
+
+    def get_status(self) -> dict:
+        """
+        Get current language lock status.
+        
+        Returns:
+            dict: Status information
+        """
+        status = self.get_status_brief()
+        status['recent_detections'] = list(self.detections)
         
         if self.warmup_start and not self.locked:
-            warmup_elapsed = time.time() - self.warmup_start
+            warmup_elapsed = time.monotonic() - self.warmup_start
             status['warmup_progress'] = warmup_elapsed / self.warmup_duration
             status['warmup_elapsed'] = warmup_elapsed
         
-        if self.detections:
-            lang_counts = Counter(self.detections)
-            status['language_distribution'] = dict(lang_counts)
-            if lang_counts:
-                most_common_lang, count = lang_counts.most_common(1)[0]
-                status['leading_language'] = most_common_lang
-                status['leading_confidence'] = count / len(self.detections)
+        if self._total:
+            status['language_distribution'] = dict(self._counts)
+            most_common_lang, count = self._counts.most_common(1)[0]
+            status['leading_language'] = most_common_lang
+            status['leading_confidence'] = count / self._total
         
         return status
 
@@ -179,6 +200,10 @@ class LanguageLockManager:
         """Reset language lock state"""
         self.current_language = self.initial_language
         self.locked = (self.initial_language != 'auto')
+        self._ignore_detections = (not self.enabled) or self.locked
         self.warmup_start = None
-        self.detections = []
+        self._warmup_deadline = None
+        self._counts.clear()
+        self._total = 0
+        self.detections.clear()
         logger.info("Language lock manager reset")
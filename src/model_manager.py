@@ -66,7 +66,7 @@ class ModelManager:
                 logger.error("❌ NPU inference returned no outputs")
                 return None
 
-            logger.debug(f"🚀 NPU Inference: {inference_time:.1f}ms | Output: {outputs[0].shape}")
+            logger.debug("🚀 NPU Inference: %.1fms | Output: %s", inference_time, outputs[0].shape)
 
             return outputs[0]
 
@@ -9,6 +9,8 @@ import logging
 import numpy as np
 from typing import Optional, Tuple
 
+from audio_kernels import int16_rms
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,12 +29,17 @@ class NoiseFloorCalibrator:
         self.noise_floor = None
         
         # Bootstrap calibration state
-        self.rms_accum = []
+        self.rms_accum = []  # RMS of each newly arrived block
         self.seen_for_calib = 0
         self.calib_needed = 0  # Will be set based on sample rate
-        
-        # Adaptive tracking state
-        self.noise_floor_history = []
+        self._calib_pos = 0  # Samples of the (growing) bootstrap buffer already measured
+        
+        # Adaptive tracking state: fixed ring of the most recent non-speech RMS values
+        self.history_window = 50  # Median is taken over the last 50 segments
+        self._nf_hist = np.empty(self.history_window, dtype=np.float32)
+        self._nf_scratch = np.empty(self.history_window, dtype=np.float32)  # Partitioned copy
+        self._nf_idx = 0
+        self._nf_fill = 0
         self.noise_update_counter = 0
         self.noise_update_interval = 50  # Update every 50 non-speech chunks
 
@@ -62,10 +69,16 @@ class NoiseFloorCalibrator:
         if self.seen_for_calib >= self.calib_needed:
             return True  # Calibration complete
         
-        # Calculate RMS for calibration sample
-        sample = audio_buffer[:min(len(audio_buffer), self.calib_needed)]
-        rms = self._calculate_rms(sample)
-        self.rms_accum.append(rms)
+        # The buffer only grows during calibration; measure just the new samples
+        # (each sample once, no re-scan of the whole prefix)
+        if len(audio_buffer) < self._calib_pos:
+            self._calib_pos = 0
+        end = min(len(audio_buffer), self._calib_pos + self.calib_needed - self.seen_for_calib)
+        sample = audio_buffer[self._calib_pos:end]
+        self._calib_pos = end
+        if len(sample) == 0:
+            return False
+        self.rms_accum.append(self._calculate_rms(sample))
         self.seen_for_calib += len(sample)
         
         if self.seen_for_calib >= self.calib_needed:
@@ -85,24 +98,37 @@ class NoiseFloorCalibrator:
         if self.noise_floor is None:
             return
         
-        self.noise_floor_history.append(rms)
+        self._nf_hist[self._nf_idx] = rms
+        self._nf_idx = (self._nf_idx + 1) % self.history_window
+        self._nf_fill = min(self._nf_fill + 1, self.history_window)
         self.noise_update_counter += 1
         
         if self.noise_update_counter >= self.noise_update_interval:
-            if len(self.noise_floor_history) >= 20:
-                # Use median of recent non-speech segments
-                new_noise_floor = float(np.median(self.noise_floor_history[-50:]))
+            if self._nf_fill >= 20:
+                # Use median of recent non-speech segments (order-independent, so
+                # the ring is used as-is)
+                new_noise_floor = self._history_median()
                 
                 # Only update if change is significant (avoid micro-adjustments)
                 if abs(new_noise_floor - self.noise_floor) > 0.0001:
                     logger.info(f"🔄 Updated noise floor: {self.noise_floor:.6f} → {new_noise_floor:.6f}")
                     self.noise_floor = new_noise_floor
-                
-                # Keep recent history
-                self.noise_floor_history = self.noise_floor_history[-100:]
             
             self.noise_update_counter = 0
 
+    def _history_median(self) -> float:
+        """Median of the filled history via an in-place partial sort of a scratch copy"""
+        n = self._nf_fill
+        k = n // 2
+        part = self._nf_scratch[:n]
+        part[:] = self._nf_hist[:n]
+        if n % 2:
+            part.partition(k)
+            return float(part[k])
+        # Even count: mean of the two middle values (same as np.median)
+        part.partition((k - 1, k))
+        return (float(part[k - 1]) + float(part[k])) / 2.0
+
     def get_noise_floor(self) -> Optional[float]:
         """
         Get current noise floor value.
@@ -126,7 +152,9 @@ class NoiseFloorCalibrator:
         self.noise_floor = None
         self.rms_accum = []
         self.seen_for_calib = 0
-        self.noise_floor_history = []
+        self._calib_pos = 0
+        self._nf_idx = 0
+        self._nf_fill = 0
         self.noise_update_counter = 0
         logger.info("Noise floor calibration reset")
 
@@ -144,13 +172,13 @@ class NoiseFloorCalibrator:
         if len(audio) == 0:
             return 0.0
         
-        # Normalize int16 to float32 range [-1.0, 1.0]
         if audio.dtype == np.int16:
-            x = audio.astype(np.float32) * (1.0 / 32768.0)
-        else:
-            x = audio.astype(np.float32)
+            # Native int64 sum of squares, no float copy
+            return int16_rms(audio)
         
-        return float(np.sqrt(np.mean(x ** 2) + 1e-12))
+        n = len(audio)
+        x = np.asarray(audio, dtype=np.float32)
+        return float(np.sqrt(np.dot(x, x) / n + 1e-12))
 
     def get_calibration_progress(self) -> dict:
         """
@@ -165,5 +193,5 @@ class NoiseFloorCalibrator:
             'progress': self.seen_for_calib / self.calib_needed if self.calib_needed > 0 else 0,
             'samples_collected': self.seen_for_calib,
             'samples_needed': self.calib_needed,
-            'history_size': len(self.noise_floor_history)
+            'history_size': self._nf_fill
         }
@@ -32,6 +32,8 @@ from preprocessing_stage import PreprocessingStage
 from inference_stage import InferenceStage
 from postprocessing_stage import PostprocessingStage
 from async_emitter import AsyncEmitter
+from pipeline_types import AudioChunk
+from thread_tuning import tune_thread
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +97,8 @@ class PipelineOrchestrator:
             audio_processor,
             noise_calibrator,
             language_manager,
-            config
+            config,
+            transcription_decoder
         )
         
         self.inference_stage = InferenceStage(
@@ -150,6 +153,12 @@ class PipelineOrchestrator:
                 self.stop()  # Clean up already started stages
                 return False
         
+        # Compute stages on the fast cores, I/O-bound emitter on little cores
+        for stage in self.stages:
+            tune_thread(stage.worker_thread, self.config.get('worker_cpus'),
+                        self.config.get('worker_nice'))
+        tune_thread(self.async_emitter.emit_thread, self.config.get('emitter_cpus'))
+        
         self.is_running = True
         logger.info("✅ Parallel processing pipeline started (3 stages + async emitter)")
         logger.info("    Stage 1: Preprocessing (Resample + VAD + Features)")
@@ -194,10 +203,7 @@ class PipelineOrchestrator:
         
         try:
             # Non-blocking put to prevent audio callback blocking
-            self.preprocess_queue.put_nowait({
-                'audio_buffer': audio_buffer,
-                'chunk_counter': chunk_counter
-            })
+            self.preprocess_queue.put_nowait(AudioChunk(audio_buffer, chunk_counter))
             return True
         except queue.Full:
             logger.warning("⚠️ Preprocessing queue full, dropping audio chunk")
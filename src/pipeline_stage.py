@@ -14,6 +14,7 @@ Following SOLID principles:
 import logging
 import queue
 import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Dict
 
@@ -120,7 +121,6 @@ class PipelineStage(ABC):
                     break
                 
                 # Process the item
-                import time
                 start_time = time.time()
                 
                 result = self.process(item)
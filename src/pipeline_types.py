@@ -0,0 +1,44 @@
+"""
+Pipeline Types
+==============
+Typed items passed between the parallel pipeline stages.
+
+Slotted dataclasses instead of dicts: fixed fields, smaller per-item
+footprint and attribute (not hash) lookups on every stage hop.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class AudioChunk:
+    """Raw audio window submitted to the preprocessing stage"""
+    audio_buffer: np.ndarray  # Device sample rate
+    chunk_counter: int
+
+
+@dataclass(slots=True)
+class PreprocessedChunk:
+    """Preprocessing output / inference input"""
+    mel_features: np.ndarray  # Pooled RKNN input tensor, reused after inference
+    audio_hash: Optional[int]  # None when audio dedup is disabled
+    vad_metrics: Dict[str, Any]
+    language: str
+    use_itn: bool
+    chunk_counter: int
+    audio_x16: Optional[np.ndarray] = None  # Keep for potential post-analysis
+
+
+@dataclass(slots=True)
+class InferenceResult:
+    """Inference output / postprocessing input"""
+    npu_output: np.ndarray
+    audio_hash: Optional[int]
+    language: str
+    use_itn: bool
+    chunk_counter: int
+    inference_time_ns: int
+    vad_metrics: Dict[str, Any] = field(default_factory=dict)
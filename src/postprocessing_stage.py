@@ -17,6 +17,7 @@ This stage is CPU-bound and runs in parallel with preprocessing and NPU inferenc
 import logging
 from typing import Any, Optional, Dict
 from pipeline_stage import PipelineStage
+from pipeline_types import InferenceResult
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +26,7 @@ class PostprocessingStage(PipelineStage):
     """
     Postprocessing stage: Decode → Merge → Post-process → Emit.
     
-    Input: {
-        'npu_output': np.ndarray,
-        'audio_hash': str,
-        'language': str,
-        'use_itn': bool,
-        'chunk_counter': int,
-        'inference_time_ms': float
-    }
+    Input: InferenceResult (NPU output + chunk metadata)
     
     Output: None (emits directly via async_emitter)
     """
@@ -64,11 +58,11 @@ class PostprocessingStage(PipelineStage):
         self.config = config
         
         self.enable_timeline_merging = (timeline_merger is not None)
-        self.chunk_duration_ms = config['chunk_duration'] * 1000
+        self.chunk_duration_ms = int(round(config['chunk_duration'] * 1000))  # Integer offsets for the merger
         
         logger.info("PostprocessingStage initialized")
 
-    def process(self, item: Dict[str, Any]) -> Optional[Any]:
+    def process(self, item: InferenceResult) -> Optional[Any]:
         """
         Process inference results through postprocessing pipeline.
         
@@ -79,15 +73,15 @@ class PostprocessingStage(PipelineStage):
             None (emits via async_emitter)
         """
         try:
-            npu_output = item['npu_output']
-            audio_hash = item['audio_hash']
-            chunk_counter = item['chunk_counter']
+            npu_output = item.npu_output
+            audio_hash = item.audio_hash
+            chunk_counter = item.chunk_counter
             
             # Step 1: Decode NPU output to text
             result = self.decoder.decode_output(npu_output, audio_hash)
             
             if result is None:
-                logger.debug(f"Decoder returned None for hash {audio_hash}")
+                logger.debug("Decoder returned None for hash %s", audio_hash)
                 return None
             
             # Store audio hash for deduplication
@@ -101,7 +95,7 @@ class PostprocessingStage(PipelineStage):
             # Step 3: Apply metadata filtering
             should_filter, filter_reason = self.formatter.check_metadata_filter(result)
             if should_filter:
-                logger.debug(f"🚫 {filter_reason}: '{result['text']}'")
+                logger.debug("🚫 %s: '%s'", filter_reason, result['text'])
                 return None
             
             # Step 4: Process based on merging mode
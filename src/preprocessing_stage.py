@@ -13,10 +13,10 @@ This stage is CPU-bound and runs in parallel with NPU inference.
 """
 
 import logging
-import hashlib
 import numpy as np
-from typing import Any, Optional, Dict
+from typing import Optional
 from pipeline_stage import PipelineStage
+from pipeline_types import AudioChunk, PreprocessedChunk
 
 logger = logging.getLogger(__name__)
 
@@ -25,18 +25,12 @@ class PreprocessingStage(PipelineStage):
     """
     Preprocessing stage: Resample → VAD → Feature Extraction.
     
-    Input: Raw audio buffer (device sample rate)
-    Output: {
-        'mel_features': np.ndarray,
-        'audio_hash': str,
-        'vad_metrics': dict,
-        'language': str,
-        'use_itn': bool
-    }
+    Input: AudioChunk (raw audio buffer at device sample rate)
+    Output: PreprocessedChunk (features, hash, VAD metrics, language settings)
     """
 
     def __init__(self, input_queue, output_queue, audio_processor, 
-                 noise_calibrator, language_manager, config):
+                 noise_calibrator, language_manager, config, decoder):
         """
         Initialize preprocessing stage.
         
@@ -47,6 +41,7 @@ class PreprocessingStage(PipelineStage):
             noise_calibrator: NoiseFloorCalibrator instance
             language_manager: LanguageLockManager instance
             config: Configuration dictionary
+            decoder: TranscriptionDecoder (owns the dedup setting and recent hashes)
         """
         super().__init__("Preprocessing", input_queue, output_queue)
         
@@ -54,49 +49,62 @@ class PreprocessingStage(PipelineStage):
         self.noise_calibrator = noise_calibrator
         self.language_manager = language_manager
         self.config = config
+        self.decoder = decoder
         
         logger.info("PreprocessingStage initialized")
 
-    def process(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def process(self, item: AudioChunk) -> Optional[PreprocessedChunk]:
         """
         Process raw audio buffer through preprocessing pipeline.
         
         Args:
-            item: {
-                'audio_buffer': np.ndarray (device rate),
-                'chunk_counter': int
-            }
+            item: Raw audio window and its chunk counter
             
         Returns:
-            Preprocessed features dict or None if no speech detected
+            Preprocessed chunk or None if no speech detected
         """
         try:
-            audio_buffer = item['audio_buffer']
-            chunk_counter = item['chunk_counter']
+            audio_buffer = item.audio_buffer
+            chunk_counter = item.chunk_counter
+            
+            # Step 0: Reject clearly silent windows before the VAD features
+            noise_floor = self.noise_calibrator.get_noise_floor()
+            silent = self.audio_processor.fast_reject(audio_buffer, noise_floor)
             
             # Step 1: Resample to model rate (16kHz)
             x16 = self.audio_processor.resample_to_model_rate(audio_buffer)
             
+            if silent:
+                # Noise floor history stays on the model-rate RMS scale
+                self.noise_calibrator.update_adaptive_noise_floor(self.audio_processor.calculate_rms(x16))
+                return None
+            
             # Step 2: Voice Activity Detection
-            noise_floor = self.noise_calibrator.get_noise_floor()
             is_speech, vad_metrics = self.audio_processor.is_speech_segment(x16, noise_floor)
             
             if not is_speech:
-                logger.debug(f"Skip (VAD): RMS={vad_metrics['rms']:.4f} "
-                           f"ZCR={vad_metrics['zcr']:.3f} "
-                           f"Entropy={vad_metrics['spectral_entropy']:.3f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Skip (VAD): RMS=%.4f ZCR=%.3f Entropy=%.3f",
+                                 vad_metrics['rms'], vad_metrics['zcr'],
+                                 vad_metrics['spectral_entropy'])
                 
                 # Update adaptive noise floor
                 self.noise_calibrator.update_adaptive_noise_floor(vad_metrics['rms'])
                 
                 return None  # Skip non-speech
             
-            logger.debug(f"✅ Speech detected: RMS={vad_metrics['rms']:.4f} "
-                       f"ZCR={vad_metrics['zcr']:.3f} "
-                       f"Entropy={vad_metrics['spectral_entropy']:.3f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Speech detected: RMS=%.4f ZCR=%.3f Entropy=%.3f",
+                             vad_metrics['rms'], vad_metrics['zcr'],
+                             vad_metrics['spectral_entropy'])
+            
+            # Step 3: Generate audio fingerprint for deduplication (skipped when disabled)
+            audio_hash = self.audio_processor.fingerprint(x16) if self.decoder.dedup_enabled else None
             
-            # Step 3: Generate audio fingerprint for deduplication
-            audio_hash = hashlib.md5(x16.tobytes()).hexdigest()[:16]
+            # Already decoded: skip features and inference entirely
+            if self.decoder.is_duplicate(audio_hash):
+                logger.debug("🔄 Skip duplicate audio chunk (hash: %016x)", audio_hash)
+                return None
             
             # Step 4: Start language warmup on first speech
             if self.language_manager.is_enabled() and not self.language_manager.is_locked():
@@ -115,15 +123,15 @@ class PreprocessingStage(PipelineStage):
                 return None
             
             # Return preprocessed data for next stage
-            return {
-                'mel_features': mel_features,
-                'audio_hash': audio_hash,
-                'vad_metrics': vad_metrics,
-                'language': current_language,
-                'use_itn': self.config['use_itn'],
-                'chunk_counter': chunk_counter,
-                'audio_x16': x16  # Keep for potential post-analysis
-            }
+            return PreprocessedChunk(
+                mel_features=mel_features,
+                audio_hash=audio_hash,
+                vad_metrics=vad_metrics,
+                language=current_language,
+                use_itn=self.config['use_itn'],
+                chunk_counter=chunk_counter,
+                audio_x16=x16  # Keep for potential post-analysis
+            )
             
         except Exception as e:
             logger.error(f"Preprocessing error: {e}", exc_info=True)
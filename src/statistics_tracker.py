@@ -21,19 +21,15 @@ class StatisticsTracker:
         """Reset all statistics"""
         self.stats = {
             'total_chunks_processed': 0,
-            'total_inference_time': 0.0,
-            'average_inference_time': 0.0,
+            'total_inference_ns': 0,  # Integer accumulator; ms values derived on read
             'errors': 0,
             'start_time': time.time()
         }
 
-    def record_inference(self, inference_time_ms: float) -> None:
-        """Record an inference operation"""
+    def record_inference(self, inference_time_ns: int) -> None:
+        """Record an inference operation (duration from time.perf_counter_ns)"""
         self.stats['total_chunks_processed'] += 1
-        self.stats['total_inference_time'] += inference_time_ms
-        self.stats['average_inference_time'] = (
-            self.stats['total_inference_time'] / self.stats['total_chunks_processed']
-        )
+        self.stats['total_inference_ns'] += inference_time_ns
 
     def record_error(self) -> None:
         """Record an error"""
@@ -43,9 +39,13 @@ class StatisticsTracker:
         """Get current statistics"""
         current_time = time.time()
         total_time = current_time - self.stats['start_time']
+        chunks = self.stats['total_chunks_processed']
+        total_inference_ms = self.stats['total_inference_ns'] / 1e6
 
         return {
             **self.stats,
+            'total_inference_time': total_inference_ms,
+            'average_inference_time': total_inference_ms / chunks if chunks > 0 else 0.0,
             'total_runtime_seconds': total_time,
             'chunks_per_second': self.stats['total_chunks_processed'] / total_time if total_time > 0 else 0,
             'error_rate': self.stats['errors'] / self.stats['total_chunks_processed'] if self.stats['total_chunks_processed'] > 0 else 0
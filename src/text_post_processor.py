@@ -5,8 +5,15 @@ Handles punctuation restoration, spell correction, and semantic refinement.
 
 from typing import Optional
 import logging
+import time
 from pathlib import Path
 
+try:
+    # Fuzzy string matching for boundary refinement (optional)
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +29,7 @@ class TextPostProcessor:
         # Models (lazy loaded)
         self.punct_model = None
         self.symspell = None
+        self._verbosity_closest = None  # symspellpy Verbosity.CLOSEST, bound on load
         self.embedder = None
         
         self._last_sentence = ""
@@ -64,6 +72,7 @@ class TextPostProcessor:
                 from symspellpy import SymSpell, Verbosity
                 logger.info("⏳ Loading spell checker...")
                 self.symspell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
+                self._verbosity_closest = Verbosity.CLOSEST
                 
                 # Load dictionary
                 dict_path = self.config.get(
@@ -149,7 +158,6 @@ class TextPostProcessor:
             return text
         
         try:
-            from symspellpy import Verbosity
             tokens = text.split()
             fixed_tokens = []
             corrections_made = []
@@ -174,7 +182,7 @@ class TextPostProcessor:
                 # Look up correction
                 suggestions = self.symspell.lookup(
                     clean_token.lower(),
-                    Verbosity.CLOSEST,
+                    self._verbosity_closest,
                     max_edit_distance=2,
                     include_unknown=True
                 )
@@ -217,9 +225,12 @@ class TextPostProcessor:
         if self.embedder is None:
             return current_text
         
+        if fuzz is None:
+            logger.warning("⚠️ rapidfuzz not installed - boundary refinement disabled")
+            self.enable_semantic_refinement = False
+            return current_text
+        
         try:
-            from rapidfuzz import fuzz
-            
             prev_tail = ' '.join(prev_text.split()[-6:])
             cur_head = ' '.join(current_text.split()[:6])
             
@@ -233,10 +244,6 @@ class TextPostProcessor:
             logger.debug(f"🔍 Boundary similarity: {similarity}% (no refinement applied)")
             return current_text
             
-        except ImportError:
-            logger.warning("⚠️ rapidfuzz not installed - boundary refinement disabled")
-            self.enable_semantic_refinement = False
-            return current_text
         except Exception as e:
             logger.debug(f"⚠️ Boundary refinement failed: {e}")
             return current_text
@@ -260,7 +267,6 @@ class TextPostProcessor:
         original = text
         
         # Track timing for performance monitoring
-        import time
         start = time.time()
         
         # 1. Semantic boundary refinement (if enabled and context available)
@@ -280,7 +286,7 @@ class TextPostProcessor:
         if latency_ms > 20:
             logger.warning(f"⚠️ Post-processing slow: {latency_ms:.1f}ms")
         elif latency_ms > 5:
-            logger.debug(f"⏱️ Post-processing: {latency_ms:.1f}ms")
+            logger.debug("⏱️ Post-processing: %.1fms", latency_ms)
         
         # Log changes
         if text != original:
@@ -0,0 +1,78 @@
+"""
+Thread Tuning
+=============
+Best-effort CPU affinity and scheduling priority for pipeline threads.
+
+On the RK3588 (Orange Pi 5 Max) cores 4-7 are the fast Cortex-A76 cluster
+and cores 0-3 the Cortex-A55 efficiency cluster. Compute-heavy threads are
+pinned to the big cores, I/O-bound ones to little cores. Every operation
+degrades gracefully (non-Linux hosts, fewer cores, missing CAP_SYS_NICE).
+
+Negative nice values and SCHED_FIFO need CAP_SYS_NICE in the container
+(`cap_add: [SYS_NICE]` or `privileged: true`); without it they are skipped.
+"""
+
+import logging
+import os
+import threading
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def tune_thread(thread: threading.Thread, cpus: Optional[Iterable[int]] = None,
+                nice: Optional[int] = None, rt_priority: Optional[int] = None) -> None:
+    """
+    Pin a started thread to CPUs and adjust its nice value.
+
+    Args:
+        thread: Running thread (must have a native_id)
+        cpus: CPU ids to pin to (ignored if none are available)
+        nice: Nice value to set (negative values need CAP_SYS_NICE)
+        rt_priority: SCHED_FIFO priority (1-99) to switch to; None/0 keeps the default policy
+    """
+    tid = getattr(thread, 'native_id', None)
+    if tid is None:
+        return
+    _apply(tid, thread.name, cpus, nice, rt_priority)
+
+
+def tune_current_thread(cpus: Optional[Iterable[int]] = None, nice: Optional[int] = None,
+                        rt_priority: Optional[int] = None) -> None:
+    """
+    Same as tune_thread() for the calling thread, e.g. a native audio callback
+    thread that has no threading.Thread object to pass around.
+
+    Args:
+        cpus: CPU ids to pin to (ignored if none are available)
+        nice: Nice value to set (negative values need CAP_SYS_NICE)
+        rt_priority: SCHED_FIFO priority (1-99) to switch to; None/0 keeps the default policy
+    """
+    tid = threading.get_native_id()
+    _apply(tid, threading.current_thread().name, cpus, nice, rt_priority)
+
+
+def _apply(tid: int, name: str, cpus: Optional[Iterable[int]], nice: Optional[int],
+           rt_priority: Optional[int]) -> None:
+    """Apply affinity, nice value and realtime policy to a native thread id"""
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        try:
+            target = set(cpus) & os.sched_getaffinity(0)
+            if target:
+                os.sched_setaffinity(tid, target)
+                logger.info(f"📌 Thread '{name}' pinned to CPUs {sorted(target)}")
+        except OSError as e:
+            logger.debug(f"Could not set affinity for '{name}': {e}")
+
+    if nice is not None and hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, tid, nice)
+        except OSError as e:
+            logger.debug(f"Could not set nice={nice} for '{name}': {e}")
+
+    if rt_priority and hasattr(os, 'sched_setscheduler'):
+        try:
+            os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(rt_priority))
+            logger.info(f"⏱️ Thread '{name}' running SCHED_FIFO priority {rt_priority}")
+        except OSError as e:
+            logger.debug(f"Could not set SCHED_FIFO priority {rt_priority} for '{name}': {e}")
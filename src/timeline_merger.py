@@ -32,7 +32,7 @@ class TimelineMerger:
         logger.info(f"✅ TimelineMerger initialized | overlap_conf={self.overlap_confidence_threshold:.2f} | "
                    f"min_word_conf={self.min_word_confidence:.2f}")
     
-    def merge_chunk(self, words_with_timing: List[Dict[str, Any]], chunk_offset_ms: float) -> List[Dict[str, Any]]:
+    def merge_chunk(self, words_with_timing: List[Dict[str, Any]], chunk_offset_ms: int) -> List[Dict[str, Any]]:
         """
         Merge new chunk into global timeline.
         
@@ -59,13 +59,14 @@ class TimelineMerger:
             
             # Filter out low-confidence words
             if word_confidence < self.min_word_confidence:
-                logger.debug(f"🔇 Skip low-confidence word: '{word_text}' (conf={word_confidence:.3f})")
+                logger.debug("🔇 Skip low-confidence word: '%s' (conf=%.3f)", word_text, word_confidence)
                 skipped_count += 1
                 continue
             
             # Case 1: Word entirely before last emit time → already processed
             if global_end_ms <= self.last_emit_time_ms:
-                logger.debug(f"⏭️ Skip already emitted: '{word_text}' (end={global_end_ms:.0f}ms < last={self.last_emit_time_ms:.0f}ms)")
+                logger.debug("⏭️ Skip already emitted: '%s' (end=%.0fms < last=%.0fms)",
+                             word_text, global_end_ms, self.last_emit_time_ms)
                 skipped_count += 1
                 continue
             
@@ -78,12 +79,13 @@ class TimelineMerger:
                     )
                     if replaced:
                         replaced_count += 1
-                        logger.debug(f"🔄 Replaced overlapping word with higher confidence: '{word_text}'")
+                        logger.debug("🔄 Replaced overlapping word with higher confidence: '%s'", word_text)
                         # Note: Already added to new_words in _try_replace_overlapping_word
                         continue
                 else:
                     # Skip overlapping words if replacement disabled
-                    logger.debug(f"⏭️ Skip overlapping word: '{word_text}' (start={global_start_ms:.0f}ms < last={self.last_emit_time_ms:.0f}ms)")
+                    logger.debug("⏭️ Skip overlapping word: '%s' (start=%.0fms < last=%.0fms)",
+                                 word_text, global_start_ms, self.last_emit_time_ms)
                     skipped_count += 1
                     continue
             
@@ -98,7 +100,8 @@ class TimelineMerger:
                 new_words.append(new_word)
                 self.global_timeline.append(new_word)
                 self.last_emit_time_ms = max(self.last_emit_time_ms, global_end_ms)
-                logger.debug(f"✅ New word: '{word_text}' ({global_start_ms:.0f}-{global_end_ms:.0f}ms, conf={word_confidence:.3f})")
+                logger.debug("✅ New word: '%s' (%.0f-%.0fms, conf=%.3f)",
+                             word_text, global_start_ms, global_end_ms, word_confidence)
         
         if new_words or replaced_count > 0:
             logger.info(f"🔀 Merged chunk: {len(new_words)} new words, {replaced_count} replaced, {skipped_count} skipped")
@@ -122,8 +125,8 @@ class TimelineMerger:
                 # Words overlap in time
                 if new_confidence > prev_word_info['confidence'] + self.overlap_confidence_threshold:
                     # New version is significantly more confident
-                    logger.debug(f"🔄 Replace '{prev_word_info['word']}' (conf={prev_word_info['confidence']:.3f}) "
-                               f"with '{new_word}' (conf={new_confidence:.3f})")
+                    logger.debug("🔄 Replace '%s' (conf=%.3f) with '%s' (conf=%.3f)",
+                                 prev_word_info['word'], prev_word_info['confidence'], new_word, new_confidence)
                     
                     # Update timeline
                     self.global_timeline[i] = {
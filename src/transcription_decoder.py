@@ -7,8 +7,8 @@ Extracts rich metadata: emotions (SER), audio events (AED), and language detecti
 """
 
 import re
-import hashlib
-from collections import deque
+import time
+from collections import OrderedDict, deque
 import numpy as np
 from typing import Optional, Dict, Any, List
 import logging
@@ -118,8 +118,10 @@ class TranscriptionDecoder:
         self.last_texts = deque(maxlen=6)  # Increased window for better duplicate detection
         self._last_emit_ts = 0.0
         self._similarity_threshold = config.get('similarity_threshold', 0.85)  # Fuzzy matching threshold
-        self._chunk_hashes = deque(maxlen=10)  # Track recent audio chunk hashes
-        self._hash_to_text = {}  # Map audio hash to transcription
+        self.dedup_enabled = config.get('enable_audio_dedup', True)  # Audio-hash deduplication
+        # Recent audio chunk hash -> transcription, oldest first (bounded LRU)
+        self._hash_to_text = OrderedDict()
+        self._hash_cap = 10
         
         # Confidence-gated stitching
         self._enable_confidence_stitching = config.get('enable_confidence_stitching', True)
@@ -149,19 +151,35 @@ class TranscriptionDecoder:
             logger.error(f"❌ Tokenizer loading failed: {e}")
             return False
 
-    def add_audio_hash(self, audio_hash: str, transcription: Dict[str, Any]) -> None:
+    def add_audio_hash(self, audio_hash: Optional[int], transcription: Dict[str, Any]) -> None:
         """Track audio hash to prevent processing same audio chunk multiple times"""
-        self._chunk_hashes.append(audio_hash)
+        if not self.dedup_enabled or audio_hash is None:
+            return
+        
         self._hash_to_text[audio_hash] = transcription
+        self._hash_to_text.move_to_end(audio_hash)
         
-        # Clean up old mappings
-        if len(self._hash_to_text) > 20:
-            # Remove oldest entries
-            oldest_hashes = list(self._hash_to_text.keys())[:-15]
-            for h in oldest_hashes:
-                self._hash_to_text.pop(h, None)
-
-    def decode_output(self, output_tensor: np.ndarray, audio_hash: str = None) -> Optional[Dict[str, Any]]:
+        # Evict the oldest mapping (O(1), no key list rebuild)
+        if len(self._hash_to_text) > self._hash_cap:
+            self._hash_to_text.popitem(last=False)
+
+    def is_duplicate(self, audio_hash: Optional[int]) -> bool:
+        """
+        Check whether this audio window was already decoded recently.
+
+        Lets callers drop a repeated window before feature extraction and NPU
+        inference instead of after decoding. Safe only because the fingerprint
+        covers the whole window, so a hit means identical audio.
+
+        Args:
+            audio_hash: Audio fingerprint (None when dedup is disabled)
+
+        Returns:
+            bool: True if the window should be skipped
+        """
+        return self.dedup_enabled and audio_hash is not None and audio_hash in self._hash_to_text
+
+    def decode_output(self, output_tensor: np.ndarray, audio_hash: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Decode NPU output -> structured transcription with rich metadata:
         - Audio chunk deduplication
@@ -179,11 +197,9 @@ class TranscriptionDecoder:
         """
         try:
             # Check if we've already processed this audio chunk
-            if audio_hash and audio_hash in self._chunk_hashes:
-                cached_result = self._hash_to_text.get(audio_hash)
-                if cached_result:
-                    logger.debug(f"🔄 Skip duplicate audio chunk (hash: {audio_hash[:8]}...)")
-                    return None
+            if self.is_duplicate(audio_hash):
+                logger.debug("🔄 Skip duplicate audio chunk (hash: %016x)", audio_hash)
+                return None
             
             def unique_consecutive_with_confidence(arr, probs):
                 """Collapse consecutive tokens and track max confidence per unique token"""
@@ -234,7 +250,7 @@ class TranscriptionDecoder:
             blank_prob = probs[self.blank_id, :]                       # [T]
             avg_blank = float(np.mean(blank_prob))
             if avg_blank > 0.97:
-                logger.debug(f"🔇 Drop by blank gate (avg_blank={avg_blank:.3f})")
+                logger.debug("🔇 Drop by blank gate (avg_blank=%.3f)", avg_blank)
                 return None
 
             # --- Argmax decode (CTC) with confidence tracking and timestamps
@@ -270,13 +286,13 @@ class TranscriptionDecoder:
             
             # Debug: Log raw text to see emotion tokens
             if text != text_clean:
-                logger.debug(f"🔍 Raw model output: {text}")
-                logger.debug(f"🔍 Parsed metadata: {metadata}")
+                logger.debug("🔍 Raw model output: %s", text)
+                logger.debug("🔍 Parsed metadata: %s", metadata)
 
             # --- Require some real alphanumeric content
             alnum = re.findall(r"[A-Za-z0-9]", text_clean)
             if len(alnum) < self.config['min_chars']:
-                logger.debug(f"🔇 Too little content after cleanup: '{text_clean}'")
+                logger.debug("🔇 Too little content after cleanup: '%s'", text_clean)
                 return None
             
             # --- Confidence-gated stitching for chunk boundaries
@@ -288,7 +304,6 @@ class TranscriptionDecoder:
                 self._store_chunk_tail(text_clean, avg_confidence)
 
             # --- Enhanced duplicate suppression with fuzzy matching
-            import time
             now = time.time()
             
             # Check for exact or near-duplicate matches
@@ -297,7 +312,7 @@ class TranscriptionDecoder:
                 if similarity >= self._similarity_threshold:
                     time_since_last = now - self._last_emit_ts
                     if time_since_last < self.config['duplicate_cooldown_s']:
-                        logger.debug(f"🔁 Suppress duplicate (similarity={similarity:.2f}): '{text_clean}'")
+                        logger.debug("🔁 Suppress duplicate (similarity=%.2f): '%s'", similarity, text_clean)
                         return None
 
             self.last_texts.append(text_clean)
@@ -454,17 +469,17 @@ class TranscriptionDecoder:
                 # Decision: trim if previous tail had low confidence
                 if prev_confidence < self._confidence_threshold:
                     # Previous chunk tail was uncertain - trust current chunk
-                    logger.debug(f"🔧 Confidence-gated trim: prev_conf={prev_confidence:.3f} < {self._confidence_threshold:.3f}, "
-                               f"removing overlap: '{current_head_subset}'")
+                    logger.debug("🔧 Confidence-gated trim: prev_conf=%.3f < %.3f, removing overlap: '%s'",
+                                 prev_confidence, self._confidence_threshold, current_head_subset)
                     return ' '.join(current_words[overlap_len:])
                 elif current_confidence < self._confidence_threshold:
                     # Current chunk start is uncertain - might be better to keep previous
-                    logger.debug(f"🔧 Low confidence in current chunk start ({current_confidence:.3f}), keeping overlap")
+                    logger.debug("🔧 Low confidence in current chunk start (%.3f), keeping overlap", current_confidence)
                     return current_text
                 else:
                     # Both have good confidence - normal duplicate suppression will handle
-                    logger.debug(f"✅ Both chunks confident (prev={prev_confidence:.3f}, curr={current_confidence:.3f}), "
-                               f"overlap detected but keeping current")
+                    logger.debug("✅ Both chunks confident (prev=%.3f, curr=%.3f), overlap detected but keeping current",
+                                 prev_confidence, current_confidence)
                     return current_text
         
         # No significant overlap detected
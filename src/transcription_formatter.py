@@ -6,7 +6,9 @@ emojis, metadata, and WebSocket broadcasting.
 """
 
 import logging
+import queue
 import sys
+import threading
 from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,15 @@ class TranscriptionFormatter:
         self.show_events = config.get('show_events', True)
         self.show_language = config.get('show_language', True)
         
+        # Metadata filter settings (static for the run)
+        self.filter_bgm = config.get('filter_bgm', False)
+        self.filter_events = frozenset(config.get('filter_events') or ())
+        
+        # Console lines are written by a background thread (started on first use),
+        # so the worker never blocks on stdout
+        self._print_queue = queue.SimpleQueue()
+        self._print_thread = None
+        
         # Import emoji mappings from decoder
         self._load_emoji_mappings()
 
@@ -90,16 +101,18 @@ class TranscriptionFormatter:
         Returns:
             tuple: (should_filter, filter_reason) - bool and string reason
         """
+        audio_events = result.get('audio_events')
+        if not audio_events:
+            return False, None
+        
         # Check if BGM filtering is enabled
-        if self.config.get('filter_bgm', False):
-            if 'BGM' in result.get('audio_events', []):
-                return True, "Background music detected"
+        if self.filter_bgm and 'BGM' in audio_events:
+            return True, "Background music detected"
         
         # Check for specific event filtering
-        filter_events = self.config.get('filter_events', [])
-        if filter_events:
-            for event in result.get('audio_events', []):
-                if event in filter_events:
+        if self.filter_events:
+            for event in audio_events:
+                if event in self.filter_events:
                     return True, f"Filtered event: {event}"
         
         return False, None
@@ -114,9 +127,13 @@ class TranscriptionFormatter:
             result: Full transcription result dictionary
             new_words: Optional list of new words (for timeline merging)
         """
-        # Print to console
-        print(f"TRANSCRIPT: {display_text}")
-        sys.stdout.flush()
+        # Print to console (off-thread)
+        if self._print_thread is None:
+            self._print_thread = threading.Thread(
+                target=self._print_worker, name="ConsolePrinter", daemon=True
+            )
+            self._print_thread.start()
+        self._print_queue.put(f"TRANSCRIPT: {display_text}")
         
         # Update result for WebSocket if using timeline merging
         if new_words is not None:
@@ -125,6 +142,35 @@ class TranscriptionFormatter:
         # Broadcast via WebSocket
         self.websocket_manager.broadcast_transcription(result)
 
+    def _print_worker(self) -> None:
+        """Write queued console lines, flushing once per drained burst"""
+        while True:
+            line = self._print_queue.get()
+            if line is None:
+                break
+            lines = [line]
+            stop = False
+            while True:
+                try:
+                    line = self._print_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                lines.append(line)
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+            if stop:
+                break
+
+    def close(self) -> None:
+        """Flush pending console lines and stop the print thread"""
+        if self._print_thread is not None:
+            self._print_queue.put(None)
+            self._print_thread.join(timeout=2.0)
+            self._print_thread = None
+
     def format_debug_message(self, message: str, level: str = 'info') -> str:
         """
         Format debug message with appropriate prefix.
@@ -106,10 +106,8 @@ def main():
         logger.info("🎯 Web interface available - navigate to the transcription dashboard")
         logger.info("Press Ctrl+C to stop the server")
         
-        # Keep the main thread alive
-        while True:
-            import time
-            time.sleep(1)
+        # Keep the main thread alive without periodic wakeups (Ctrl+C interrupts the wait)
+        threading.Event().wait()
             
     except KeyboardInterrupt:
         logger.info("🔔 Received shutdown signal")
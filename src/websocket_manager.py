@@ -7,6 +7,7 @@ Handles WebSocket server setup and real-time transcription broadcasting.
 
 import asyncio
 import threading
+import time
 from typing import Optional
 import logging
 
@@ -18,6 +19,7 @@ class WebSocketManager:
     def __init__(self, config: dict):
         self.config = config
         self.websocket_server = None
+        self._ws_module = None  # websocket_server module, imported once in initialize()
         self.websocket_thread = None
         self.websocket_loop = None
         self.is_running = False
@@ -25,10 +27,12 @@ class WebSocketManager:
     def initialize(self) -> bool:
         """Initialize WebSocket server"""
         try:
-            from websocket_server import get_websocket_server
-            self.websocket_server = get_websocket_server()
+            import websocket_server
+            self._ws_module = websocket_server
+            self.websocket_server = websocket_server.get_websocket_server()
             self.websocket_server.host = self.config.get('websocket_host', '0.0.0.0')
             self.websocket_server.port = self.config.get('websocket_port', 8765)
+            self.websocket_server.batch_frames = self.config.get('enable_batch_broadcast', False)
             logger.info(f"📡 WebSocket server configured on {self.websocket_server.host}:{self.websocket_server.port}")
             return True
         except Exception as e:
@@ -63,7 +67,6 @@ class WebSocketManager:
             self.websocket_thread.start()
 
             # Give server time to start
-            import time
             time.sleep(1.0)
             self.is_running = True
             logger.info(f"✅ WebSocket server started on ws://{self.websocket_server.host}:{self.websocket_server.port}")
@@ -84,28 +87,43 @@ class WebSocketManager:
             return
 
         try:
-            from websocket_server import broadcast_transcription
-            
             # If result is a string (legacy), convert to dict
             if isinstance(result, str):
                 result = {'text': result, 'language': None, 'emotion': None, 'audio_events': []}
             
             asyncio.run_coroutine_threadsafe(
-                broadcast_transcription(result),
+                self._ws_module.broadcast_transcription(result),
                 self.websocket_loop
             )
         except Exception as e:
             logger.debug(f"⚠️ WebSocket broadcast error: {e}")
 
+    def broadcast_transcriptions(self, results: list) -> None:
+        """
+        Broadcast a batch of transcriptions with a single hand-off to the event loop.
+        
+        Args:
+            results: list of result dicts (same format as broadcast_transcription)
+        """
+        if not self.is_running or not self.websocket_loop or not results:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._ws_module.broadcast_transcriptions(results),
+                self.websocket_loop
+            )
+        except Exception as e:
+            logger.debug(f"⚠️ WebSocket batch broadcast error: {e}")
+
     def broadcast_status(self, status: dict) -> None:
         """Broadcast status update to all connected WebSocket clients"""
         if not self.is_running or not self.websocket_loop:
             return
 
         try:
-            from websocket_server import broadcast_status
             asyncio.run_coroutine_threadsafe(
-                broadcast_status(status),
+                self._ws_module.broadcast_status(status),
                 self.websocket_loop
             )
         except Exception as e:
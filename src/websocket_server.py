@@ -21,6 +21,7 @@ class TranscriptionWebSocketServer:
         self.port = port
         self.clients: Set[websockets.WebSocketServerProtocol] = set()
         self.server = None
+        self.batch_frames = False  # Send multi-result batches as one JSON-array frame (opt-in)
         
     async def register_client(self, websocket):
         """Register a new WebSocket client"""
@@ -41,18 +42,9 @@ class TranscriptionWebSocketServer:
         self.clients.discard(websocket)
         logger.info(f"🔌 Client disconnected. Total clients: {len(self.clients)}")
         
-    async def broadcast_transcription(self, result, confidence: str = "HIGH"):
-        """
-        Broadcast rich transcription with metadata to all connected clients.
-        
-        Args:
-            result: dict with keys: text, language, emotion, audio_events, raw_text
-                    or str (legacy support)
-            confidence: confidence level (for backward compatibility)
-        """
-        if not self.clients:
-            return
-        
+    @staticmethod
+    def _transcription_message(result, confidence: str) -> dict:
+        """Build the "transcription" message for one result (dict or legacy str)"""
         # Handle legacy string format
         if isinstance(result, str):
             result = {
@@ -65,7 +57,7 @@ class TranscriptionWebSocketServer:
         # Use raw_text (clean) if available, otherwise fall back to text
         display_text = result.get('raw_text') or result.get('text', '')
         
-        message = {
+        return {
             "type": "transcription",
             "text": display_text,
             "language": result.get('language'),
@@ -77,12 +69,13 @@ class TranscriptionWebSocketServer:
             "timestamp": datetime.now().isoformat(),
             "source": "npu-sensevoice"
         }
-        
-        # Send to all connected clients
+
+    async def _send_to_all(self, payload: str) -> None:
+        """Send one serialized frame to every client, dropping closed connections"""
         disconnected_clients = set()
         for client in self.clients:
             try:
-                await client.send(json.dumps(message))
+                await client.send(payload)
             except websockets.exceptions.ConnectionClosed:
                 disconnected_clients.add(client)
             except Exception as e:
@@ -93,14 +86,54 @@ class TranscriptionWebSocketServer:
         for client in disconnected_clients:
             await self.unregister_client(client)
         
-        # Format log message with metadata
-        log_parts = [result.get('text', '')]
-        if result.get('emotion'):
-            log_parts.append(f"[{result['emotion']}]")
-        if result.get('audio_events'):
-            log_parts.append(f"[{', '.join(result['audio_events'])}]")
+    async def broadcast_transcription(self, result, confidence: str = "HIGH"):
+        """
+        Broadcast rich transcription with metadata to all connected clients.
+        
+        Args:
+            result: dict with keys: text, language, emotion, audio_events, raw_text
+                    or str (legacy support)
+            confidence: confidence level (for backward compatibility)
+        """
+        if not self.clients:
+            return
+        
+        # Serialized once, then sent to all connected clients
+        message = self._transcription_message(result, confidence)
+        await self._send_to_all(json.dumps(message))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            # Format log message with metadata
+            log_parts = [message['text']]
+            if message['emotion']:
+                log_parts.append(f"[{message['emotion']}]")
+            if message['audio_events']:
+                log_parts.append(f"[{', '.join(message['audio_events'])}]")
+            logger.debug(f"📡 Broadcasted to {len(self.clients)} clients: {' '.join(log_parts)}")
         
-        logger.debug(f"📡 Broadcasted to {len(self.clients)} clients: {' '.join(log_parts)}")
+    async def broadcast_transcriptions(self, results, confidence: str = "HIGH"):
+        """
+        Broadcast a batch of transcriptions within a single event-loop task.
+        
+        With batch_frames enabled, a batch of several results goes out as one
+        frame holding a JSON array of "transcription" messages; a single result
+        is always sent as a plain message.
+        
+        Args:
+            results: list of result dicts (or str, legacy support)
+            confidence: confidence level (for backward compatibility)
+        """
+        if not self.clients or not results:
+            return
+        
+        if not self.batch_frames or len(results) == 1:
+            for result in results:
+                await self.broadcast_transcription(result, confidence)
+            return
+        
+        messages = [self._transcription_message(result, confidence) for result in results]
+        await self._send_to_all(json.dumps(messages))
+        logger.debug("📡 Broadcasted batch of %d to %d clients", len(messages), len(self.clients))
         
     async def broadcast_status(self, status: str, data: dict = None):
         """Broadcast status updates to all connected clients"""
@@ -113,20 +146,7 @@ class TranscriptionWebSocketServer:
             "timestamp": datetime.now().isoformat(),
             "data": data or {}
         }
-        
-        disconnected_clients = set()
-        for client in self.clients:
-            try:
-                await client.send(json.dumps(message))
-            except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
-            except Exception as e:
-                logger.error(f"Error sending status to client: {e}")
-                disconnected_clients.add(client)
-        
-        # Remove disconnected clients
-        for client in disconnected_clients:
-            await self.unregister_client(client)
+        await self._send_to_all(json.dumps(message))
             
     async def handle_client(self, websocket, path="/"):
         """Handle WebSocket client connections"""
@@ -224,6 +244,16 @@ async def broadcast_transcription(result, confidence: str = "HIGH"):
     server = get_websocket_server()
     await server.broadcast_transcription(result, confidence)
 
+async def broadcast_transcriptions(results, confidence: str = "HIGH"):
+    """
+    Convenience function to broadcast a batch of transcriptions.
+    
+    Args:
+        results: list of result dicts (or str, legacy support)
+    """
+    server = get_websocket_server()
+    await server.broadcast_transcriptions(results, confidence)
+
 async def broadcast_status(status: str, data: dict = None):
     """Convenience function to broadcast status"""
     server = get_websocket_server()
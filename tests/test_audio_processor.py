@@ -0,0 +1,35 @@
+"""Regression tests for the SenseVoice frontend (run with pytest from the repo root)"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("kaldi_native_fbank")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from audio_processor import WavFrontend  # noqa: E402
+
+
+@pytest.mark.parametrize("num_samples", [400, 560, 1000, 1199, 1200])
+def test_short_input_lfr_output_is_writable_for_cmvn(num_samples):
+    # Under ~1360 samples at 16 kHz there is a single LFR frame, whose strided
+    # view is already contiguous; CMVN must still be able to write into it
+    frontend = WavFrontend(fbank_backend="numpy")
+    dim = frontend.lfr_m * frontend.opts.mel_opts.num_bins
+    frontend.cmvn = np.zeros((2, dim), dtype=np.float32)
+    frontend._neg_mean = np.full(dim, -1.0, dtype=np.float32)
+    frontend._inv_std = np.full(dim, 2.0, dtype=np.float32)
+
+    rng = np.random.default_rng(0)
+    waveform = rng.uniform(-0.5, 0.5, num_samples).astype(np.float32)
+    feats = frontend.fbank(waveform)
+    lfr = frontend.apply_lfr(feats, frontend.lfr_m, frontend.lfr_n)
+    assert lfr.shape == (1, dim)
+    assert lfr.flags.writeable and lfr.flags.owndata
+
+    expected = (lfr - 1.0) * 2.0
+    out = frontend.apply_cmvn(lfr)
+    np.testing.assert_allclose(out, expected, rtol=1e-6)